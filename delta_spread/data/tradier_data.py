@@ -14,7 +14,7 @@ import requests
 from delta_spread.domain.models import OptionQuote
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Container
     from datetime import date
 
     from delta_spread.domain.models import OptionType
@@ -52,7 +52,7 @@ class TradierOptionsDataService:
         self.token = token
         self._expiries_cache: list[date] | None = None
         self._chain_cache: dict[tuple[str, date], list[OptionQuote]] = {}
-        self._raw_chain_cache: dict[tuple[str, date], Sequence[object]] = {}
+        self._raw_chain_cache: dict[tuple[str, date], list[Any]] = {}  # type: ignore[misc]
         self._stock_quote_cache: StockQuote | None = None
         self._cache_locks: dict[tuple[str, date], threading.Lock] = {}
         self._locks_lock = threading.Lock()  # Lock for managing locks
@@ -99,6 +99,32 @@ class TradierOptionsDataService:
             )
             raise
 
+    def is_cached(self, method: str, args: tuple[object, ...] = ()) -> bool:
+        """Check whether a call would be served from the in-memory cache.
+
+        Args:
+            method: Name of the data method (e.g. "get_chain")
+            args: Positional arguments the method would be called with
+
+        Returns:
+            True if the result is already cached
+        """
+        if method == "get_expiries":
+            return self._expiries_cache is not None
+        if method == "get_stock_quote":
+            return self._stock_quote_cache is not None
+        # Chain-derived methods take (symbol, expiry, ...) and read these caches
+        chain_caches: dict[str, tuple[Container[object], ...]] = {
+            "get_strikes": (self._raw_chain_cache,),
+            "get_chain": (self._chain_cache,),
+            "get_quote": (self._chain_cache, self._raw_chain_cache),
+        }
+        caches = chain_caches.get(method)
+        if caches is None or len(args) <= 1:
+            return False
+        cache_key = (str(args[0]).upper(), args[1])
+        return all(cache_key in cache for cache in caches)
+
     def get_stock_quote(self) -> StockQuote | None:
         """Fetch stock quote for the symbol.
 
@@ -263,7 +289,7 @@ class TradierOptionsDataService:
             # Check cache again inside the lock
             if cache_key in self._raw_chain_cache:
                 logger.info(f"Using cached raw chain for {symbol} {expiry}")
-                return list(self._raw_chain_cache[cache_key])
+                return self._raw_chain_cache[cache_key]
 
             # Fetch from API
             path = "/markets/options/chains"
@@ -3,26 +3,21 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from .workers.base import CallableWorker
 from .workers.manager import WorkerManager
 from .workers.options_worker import (
-    ChainResult,
-    ExpiriesResult,
-    FetchChainWorker,
-    FetchExpiriesWorker,
-    FetchQuoteWorker,
-    FetchStockQuoteWorker,
-    FetchStrikesWorker,
-    QuoteRequest,
-    QuoteResult,
-    StockQuoteResult,
-    StrikesResult,
+    fetch_quotes,
+    fetch_stock_quote,
+    has_cache,
+    is_cached,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from datetime import date
 
     from ..data.options_data import OptionsDataService
@@ -33,6 +28,26 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _push_pending[T](pending: dict[str, list[T]], request_id: str, context: T) -> None:
+    """Record the context of one caller waiting on ``request_id``."""
+    pending.setdefault(request_id, []).append(context)
+
+
+def _pop_pending[T](pending: dict[str, list[T]], request_id: str) -> T | None:
+    """Take the context of the next caller waiting on ``request_id``.
+
+    Coalesced duplicates share one request ID and the worker manager runs one
+    callback per caller, so each call answers exactly one of them.
+    """
+    contexts = pending.get(request_id)
+    if not contexts:
+        return None
+    context = contexts.pop(0)
+    if not contexts:
+        del pending[request_id]
+    return context
+
+
 class AsyncQuoteService(QObject):
     """Async version of QuoteService using background workers.
 
@@ -69,12 +84,16 @@ class AsyncQuoteService(QObject):
         self._data_service = data_service
         self._worker_manager = worker_manager or WorkerManager()
 
-        # Pending request tracking
+        # Pending request tracking: request ID -> context of each caller.
+        # Coalesced duplicates share an ID, so one ID may have several callers.
         self._pending_expiries: str | None = None
-        self._pending_strikes: dict[str, tuple[str, date]] = {}
-        self._pending_chains: dict[str, tuple[str, date]] = {}
-        self._pending_quotes: dict[str, tuple[str, date, float, OptionType]] = {}
-        self._pending_stock_quotes: dict[str, str] = {}
+        self._pending_strikes: dict[str, list[tuple[str, date]]] = {}
+        self._pending_chains: dict[str, list[tuple[str, date]]] = {}
+        self._pending_quotes: dict[str, list[tuple[str, date, float, OptionType]]] = {}
+        self._pending_quote_batches: dict[
+            str, list[tuple[str, date, tuple[tuple[float, OptionType], ...]]]
+        ] = {}
+        self._pending_stock_quotes: dict[str, list[str]] = {}
 
     @property
     def data_service(self) -> OptionsDataService:
@@ -94,9 +113,24 @@ class AsyncQuoteService(QObject):
             or bool(self._pending_strikes)
             or bool(self._pending_chains)
             or bool(self._pending_quotes)
+            or bool(self._pending_quote_batches)
             or bool(self._pending_stock_quotes)
         )
 
+    @property
+    def has_cache(self) -> bool:
+        """Check if the data service caches what it fetches."""
+        return has_cache(self._data_service)
+
+    def is_chain_cached(self, symbol: str, expiry: date) -> bool:
+        """Check if the data service already holds the chain for an expiry.
+
+        Args:
+            symbol: Underlying symbol.
+            expiry: Expiry date.
+        """
+        return is_cached(self._data_service, "get_chain", (symbol, expiry))
+
     def fetch_expiries(self) -> str:
         """Fetch expiries asynchronously.
 
@@ -107,7 +141,10 @@ class AsyncQuoteService(QObject):
         if self._pending_expiries is not None:
             self._worker_manager.cancel(self._pending_expiries)
 
-        worker = FetchExpiriesWorker(self._data_service)
+        worker = CallableWorker(
+            self._data_service.get_expiries,
+            is_cheap=is_cached(self._data_service, "get_expiries"),
+        )
         self._pending_expiries = worker.request_id
 
         self.loading_started.emit("expiries")
@@ -127,15 +164,22 @@ class AsyncQuoteService(QObject):
         Returns:
             Request ID for tracking.
         """
-        worker = FetchStrikesWorker(self._data_service, symbol, expiry)
-        self._pending_strikes[worker.request_id] = (symbol, expiry)
+        args = (symbol, expiry)
+        worker = CallableWorker(
+            self._data_service.get_strikes,
+            args,
+            is_cheap=is_cached(self._data_service, "get_strikes", args),
+            coalesce=True,
+        )
 
         self.loading_started.emit("strikes")
 
-        return self._worker_manager.submit(
+        request_id = self._worker_manager.submit(
             worker,
             on_complete=self._on_strikes_complete,
         )
+        _push_pending(self._pending_strikes, request_id, args)
+        return request_id
 
     def fetch_chain(self, symbol: str, expiry: date) -> str:
         """Fetch full options chain asynchronously.
@@ -147,15 +191,22 @@ class AsyncQuoteService(QObject):
         Returns:
             Request ID for tracking.
         """
-        worker = FetchChainWorker(self._data_service, symbol, expiry)
-        self._pending_chains[worker.request_id] = (symbol, expiry)
+        args = (symbol, expiry)
+        worker = CallableWorker(
+            self._data_service.get_chain,
+            args,
+            is_cheap=is_cached(self._data_service, "get_chain", args),
+            coalesce=True,
+        )
 
         self.loading_started.emit("chain")
 
-        return self._worker_manager.submit(
+        request_id = self._worker_manager.submit(
             worker,
             on_complete=self._on_chain_complete,
         )
+        _push_pending(self._pending_chains, request_id, args)
+        return request_id
 
     def fetch_quote(
         self,
@@ -175,21 +226,58 @@ class AsyncQuoteService(QObject):
         Returns:
             Request ID for tracking.
         """
-        request = QuoteRequest(
-            symbol=symbol,
-            expiry=expiry,
-            strike=strike,
-            option_type=option_type,
+        args = (symbol, expiry, strike, option_type)
+        worker = CallableWorker(
+            self._data_service.get_quote,
+            args,
+            is_cheap=is_cached(self._data_service, "get_quote", args),
+            coalesce=True,
         )
-        worker = FetchQuoteWorker(self._data_service, request)
-        self._pending_quotes[worker.request_id] = (symbol, expiry, strike, option_type)
 
         self.loading_started.emit("quote")
 
-        return self._worker_manager.submit(
+        request_id = self._worker_manager.submit(
             worker,
             on_complete=self._on_quote_complete,
         )
+        _push_pending(self._pending_quotes, request_id, args)
+        return request_id
+
+    def fetch_quotes(
+        self,
+        symbol: str,
+        expiry: date,
+        contracts: Sequence[tuple[float, OptionType]],
+    ) -> str:
+        """Fetch quotes for several contracts of one expiry in one worker.
+
+        ``quote_loaded`` is emitted once per quoted contract when the batch
+        completes; contracts the service cannot quote are skipped.
+
+        Args:
+            symbol: Underlying symbol.
+            expiry: Expiry date shared by all contracts.
+            contracts: ``(strike, option_type)`` pairs to quote.
+
+        Returns:
+            Request ID for tracking.
+        """
+        batch = tuple(contracts)
+        worker = CallableWorker(
+            fetch_quotes,
+            (self._data_service, symbol, expiry, batch),
+            is_cheap=is_cached(self._data_service, "get_quote", (symbol, expiry)),
+            coalesce=True,
+        )
+
+        self.loading_started.emit("quotes")
+
+        request_id = self._worker_manager.submit(
+            worker,
+            on_complete=self._on_quotes_complete,
+        )
+        _push_pending(self._pending_quote_batches, request_id, (symbol, expiry, batch))
+        return request_id
 
     def fetch_stock_quote(self, symbol: str) -> str:
         """Fetch stock quote asynchronously.
@@ -200,15 +288,21 @@ class AsyncQuoteService(QObject):
         Returns:
             Request ID for tracking.
         """
-        worker = FetchStockQuoteWorker(self._data_service, symbol)
-        self._pending_stock_quotes[worker.request_id] = symbol
+        worker = CallableWorker(
+            fetch_stock_quote,
+            (self._data_service,),
+            is_cheap=is_cached(self._data_service, "get_stock_quote"),
+            coalesce=True,
+        )
 
         self.loading_started.emit("stock_quote")
 
-        return self._worker_manager.submit(
+        request_id = self._worker_manager.submit(
             worker,
             on_complete=self._on_stock_quote_complete,
         )
+        _push_pending(self._pending_stock_quotes, request_id, symbol)
+        return request_id
 
     def cancel_all(self) -> None:
         """Cancel all pending requests."""
@@ -217,6 +311,7 @@ class AsyncQuoteService(QObject):
         self._pending_strikes.clear()
         self._pending_chains.clear()
         self._pending_quotes.clear()
+        self._pending_quote_batches.clear()
         self._pending_stock_quotes.clear()
 
     def _on_expiries_complete(self, result: WorkerResult[object]) -> None:
@@ -229,12 +324,12 @@ class AsyncQuoteService(QObject):
             self.error_occurred.emit(result.request_id, result.error)
             return
 
-        if isinstance(result.data, ExpiriesResult):
-            self.expiries_loaded.emit(result.data.expiries)
+        if result.data is not None:
+            self.expiries_loaded.emit(result.data)
 
     def _on_strikes_complete(self, result: WorkerResult[object]) -> None:
         """Handle strikes fetch completion."""
-        self._pending_strikes.pop(result.request_id, None)
+        context = _pop_pending(self._pending_strikes, result.request_id)
         self.loading_finished.emit("strikes")
 
         if result.error is not None:
@@ -242,16 +337,13 @@ class AsyncQuoteService(QObject):
             self.error_occurred.emit(result.request_id, result.error)
             return
 
-        if isinstance(result.data, StrikesResult):
-            self.strikes_loaded.emit(
-                result.data.symbol,
-                result.data.expiry,
-                result.data.strikes,
-            )
+        if context is not None and result.data is not None:
+            symbol, expiry = context
+            self.strikes_loaded.emit(symbol, expiry, result.data)
 
     def _on_chain_complete(self, result: WorkerResult[object]) -> None:
         """Handle chain fetch completion."""
-        self._pending_chains.pop(result.request_id, None)
+        context = _pop_pending(self._pending_chains, result.request_id)
         self.loading_finished.emit("chain")
 
         if result.error is not None:
@@ -259,16 +351,13 @@ class AsyncQuoteService(QObject):
             self.error_occurred.emit(result.request_id, result.error)
             return
 
-        if isinstance(result.data, ChainResult):
-            self.chain_loaded.emit(
-                result.data.symbol,
-                result.data.expiry,
-                result.data.chain,
-            )
+        if context is not None and result.data is not None:
+            symbol, expiry = context
+            self.chain_loaded.emit(symbol, expiry, result.data)
 
     def _on_quote_complete(self, result: WorkerResult[object]) -> None:
         """Handle quote fetch completion."""
-        self._pending_quotes.pop(result.request_id, None)
+        context = _pop_pending(self._pending_quotes, result.request_id)
         self.loading_finished.emit("quote")
 
         if result.error is not None:
@@ -276,18 +365,30 @@ class AsyncQuoteService(QObject):
             self.error_occurred.emit(result.request_id, result.error)
             return
 
-        if isinstance(result.data, QuoteResult):
-            self.quote_loaded.emit(
-                result.data.symbol,
-                result.data.expiry,
-                result.data.strike,
-                result.data.option_type,
-                result.data.quote,
-            )
+        if context is not None and result.data is not None:
+            symbol, expiry, strike, option_type = context
+            self.quote_loaded.emit(symbol, expiry, strike, option_type, result.data)
+
+    def _on_quotes_complete(self, result: WorkerResult[object]) -> None:
+        """Handle batched quote fetch completion."""
+        context = _pop_pending(self._pending_quote_batches, result.request_id)
+        self.loading_finished.emit("quotes")
+
+        if result.error is not None:
+            logger.error("Failed to fetch quotes: %s", result.error)
+            self.error_occurred.emit(result.request_id, result.error)
+            return
+
+        if context is not None and isinstance(result.data, list):
+            symbol, expiry, contracts = context
+            quotes = cast("list[object]", result.data)
+            for (strike, option_type), quote in zip(contracts, quotes, strict=True):
+                if quote is not None:
+                    self.quote_loaded.emit(symbol, expiry, strike, option_type, quote)
 
     def _on_stock_quote_complete(self, result: WorkerResult[object]) -> None:
         """Handle stock quote fetch completion."""
-        self._pending_stock_quotes.pop(result.request_id, None)
+        symbol = _pop_pending(self._pending_stock_quotes, result.request_id)
         self.loading_finished.emit("stock_quote")
 
         if result.error is not None:
@@ -295,5 +396,6 @@ class AsyncQuoteService(QObject):
             self.error_occurred.emit(result.request_id, result.error)
             return
 
-        if isinstance(result.data, StockQuoteResult):
-            self.stock_quote_loaded.emit(result.data.symbol, result.data.quote)
+        # A missing stock quote (None) is a valid result and is still emitted
+        if symbol is not None:
+            self.stock_quote_loaded.emit(symbol, result.data)
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from ..domain.models import AggregationGrid
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChartData:
     prices: list[float]
     pnls: list[float]
@@ -58,7 +58,7 @@ class ChartPresenter:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PanelMetrics:
     net_text: str
     max_loss_text: str
@@ -10,6 +10,7 @@ import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import date
 
     from ..data.options_data import OptionsDataService
@@ -93,15 +94,36 @@ class QuoteService:
         Returns:
             Dictionary mapping (strike, option_type) to IV.
         """
-        ivs: dict[tuple[float, OptionType], float] = {}
-        for leg in strategy.legs:
-            quote = self._data_service.get_quote(
-                strategy.underlier.symbol,
-                leg.contract.expiry,
-                leg.contract.strike,
-                leg.contract.type,
-            )
-            ivs[leg.contract.strike, leg.contract.type] = quote.iv
+        contracts = [
+            (leg.contract.expiry, leg.contract.strike, leg.contract.type)
+            for leg in strategy.legs
+        ]
+        by_contract = self.get_ivs(strategy.underlier.symbol, contracts)
+        return {
+            (strike, option_type): by_contract[expiry, strike, option_type]
+            for expiry, strike, option_type in contracts
+        }
+
+    def get_ivs(
+        self,
+        symbol: str,
+        contracts: Iterable[tuple[date, float, OptionType]],
+    ) -> dict[tuple[date, float, OptionType], float]:
+        """Get implied volatilities for a set of contracts.
+
+        Args:
+            symbol: Underlying symbol.
+            contracts: (expiry, strike, option_type) tuples; repeats are
+                looked up once.
+
+        Returns:
+            Dictionary mapping each (expiry, strike, option_type) to IV.
+        """
+        ivs: dict[tuple[date, float, OptionType], float] = {}
+        for contract in contracts:
+            if contract not in ivs:
+                quote = self._data_service.get_quote(symbol, *contract)
+                ivs[contract] = quote.iv
         return ivs
 
     def get_expiries(self) -> list[date]:
@@ -110,7 +132,7 @@ class QuoteService:
         Returns:
             List of available expiry dates.
         """
-        return list(self._data_service.get_expiries())
+        return self._data_service.get_expiries()
 
     def get_strikes(self, symbol: str, expiry: date) -> list[float]:
         """Get available strikes for a symbol and expiry.
@@ -122,7 +144,7 @@ class QuoteService:
         Returns:
             List of available strike prices.
         """
-        return list(self._data_service.get_strikes(symbol, expiry))
+        return self._data_service.get_strikes(symbol, expiry)
 
     def get_stock_quote(self, symbol: str) -> StockQuote | None:  # noqa: ARG002
         """Get stock quote data.
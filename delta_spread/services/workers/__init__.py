@@ -4,37 +4,17 @@ This package provides infrastructure for executing API calls
 in background threads while keeping the UI responsive.
 """
 
-from .base import BaseWorker, WorkerResult, WorkerSignals, WorkerState
+from .base import BaseWorker, CallableWorker, WorkerResult, WorkerSignals, WorkerState
 from .manager import WorkerManager
-from .options_worker import (
-    ChainResult,
-    ExpiriesResult,
-    FetchChainWorker,
-    FetchExpiriesWorker,
-    FetchQuoteWorker,
-    FetchStockQuoteWorker,
-    FetchStrikesWorker,
-    QuoteRequest,
-    QuoteResult,
-    StockQuoteResult,
-    StrikesResult,
-)
+from .options_worker import fetch_quotes, fetch_stock_quote
 
 __all__ = [
     "BaseWorker",
-    "ChainResult",
-    "ExpiriesResult",
-    "FetchChainWorker",
-    "FetchExpiriesWorker",
-    "FetchQuoteWorker",
-    "FetchStockQuoteWorker",
-    "FetchStrikesWorker",
-    "QuoteRequest",
-    "QuoteResult",
-    "StockQuoteResult",
-    "StrikesResult",
+    "CallableWorker",
     "WorkerManager",
     "WorkerResult",
     "WorkerSignals",
     "WorkerState",
+    "fetch_quotes",
+    "fetch_stock_quote",
 ]
@@ -6,10 +6,18 @@ from abc import abstractmethod
 import contextlib
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import override
+import itertools
+import threading
+from typing import TYPE_CHECKING, override
 
 from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Request IDs only need to be unique within this process
+_next_request_id = itertools.count(1).__next__
+
 
 class WorkerState(Enum):
     """Worker execution state."""
@@ -21,7 +29,7 @@ class WorkerState(Enum):
     ERROR = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkerResult[T]:
     """Immutable result container for worker operations."""
 
@@ -63,8 +71,15 @@ class BaseWorker(QRunnable):
 
     Uses QRunnable for efficient thread pool execution.
     Subclasses implement the `execute()` method.
+
+    Attributes:
+        is_cheap: When True the work is known to be trivial (e.g. served from
+            a cache) and the manager runs it on the calling thread instead of
+            dispatching it to the thread pool.
     """
 
+    is_cheap: bool = False
+
     def __init__(self, request_id: str) -> None:
         """Initialize the worker.
 
@@ -74,7 +89,11 @@ class BaseWorker(QRunnable):
         super().__init__()
         self.request_id = request_id
         self.signals = WorkerSignals()
-        self._is_cancelled = False
+        self._cancel_event = threading.Event()
+        # Orders cancel() against the start of run(): a cancel either lands
+        # before the start check or after ``started`` has been emitted.
+        # Re-entrant so a direct-connected ``started`` slot may cancel.
+        self._start_lock = threading.RLock()
         self.setAutoDelete(True)
 
     @abstractmethod
@@ -96,15 +115,19 @@ class BaseWorker(QRunnable):
         Note: Signal emissions are wrapped in try-except to handle
         application shutdown gracefully when Qt objects are deleted.
         """
-        if self._is_cancelled:
+        # The cancellation check and the ``started`` emit happen under one
+        # lock, so a worker cancelled before it starts only emits ``cancelled``.
+        with self._start_lock:
+            cancelled = self._cancel_event.is_set()
+            if not cancelled:
+                self._safe_emit_started()
+        if cancelled:
             self._safe_emit_cancelled()
             return
 
-        self._safe_emit_started()
-
         try:
             result = self.execute()
-            if self._is_cancelled:
+            if self._cancel_event.is_set():
                 self._safe_emit_cancelled()
                 return
 
@@ -116,6 +139,10 @@ class BaseWorker(QRunnable):
             self._safe_emit_finished(worker_result)
 
         except Exception as e:  # noqa: BLE001
+            # A failure after cancellation is reported as a cancellation
+            if self._cancel_event.is_set():
+                self._safe_emit_cancelled()
+                return
             # Catch all exceptions from user code to emit as errors
             worker_result = WorkerResult(
                 data=None,
@@ -146,10 +173,71 @@ class BaseWorker(QRunnable):
             self.signals.error.emit(self.request_id, error)
 
     def cancel(self) -> None:
-        """Request cancellation of this worker."""
-        self._is_cancelled = True
+        """Request cancellation of this worker.
+
+        Safe to call from any thread; the flag is backed by a
+        ``threading.Event`` so the pool thread observes it immediately. If
+        the worker is just starting, this waits until ``started`` is emitted.
+        """
+        with self._start_lock:
+            self._cancel_event.set()
 
     @property
     def is_cancelled(self) -> bool:
         """Check if cancellation was requested."""
-        return self._is_cancelled
+        return self._cancel_event.is_set()
+
+    def coalesce_key(self) -> tuple[object, ...] | None:  # noqa: PLR6301
+        """Identify work that is interchangeable with this worker.
+
+        Returns:
+            A hashable key shared by workers producing the same result, or
+            None (the default) if this worker must always run.
+        """
+        return None
+
+
+class CallableWorker(BaseWorker):
+    """Worker that runs a single callable with fixed positional arguments.
+
+    Covers the common case of wrapping one data-service call, so no
+    dedicated subclass is needed per operation.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., object],
+        args: tuple[object, ...] = (),
+        request_id: str | None = None,
+        *,
+        is_cheap: bool = False,
+        coalesce: bool = False,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            fn: The callable to run in the background.
+            args: Positional arguments passed to ``fn``.
+            request_id: Optional request ID (a process-unique counter value
+                if not provided).
+            is_cheap: Run inline instead of on the thread pool.
+            coalesce: Share one in-flight run between workers calling the
+                same callable with equal arguments.
+        """
+        super().__init__(request_id or f"w{_next_request_id()}")
+        self._fn = fn
+        self._args = args
+        self.is_cheap = is_cheap
+        self._coalesce = coalesce
+
+    @override
+    def execute(self) -> object:
+        """Call the wrapped callable and return its result."""
+        return self._fn(*self._args)
+
+    @override
+    def coalesce_key(self) -> tuple[object, ...] | None:
+        """Key on the callable and its arguments when coalescing is enabled."""
+        if not self._coalesce:
+            return None
+        return (self._fn, *self._args)
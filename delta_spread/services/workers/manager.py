@@ -2,23 +2,27 @@
 
 from __future__ import annotations
 
+from concurrent.futures import CancelledError
 import logging
 from typing import TYPE_CHECKING, cast
 
-from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, QThreadPool, QTimer, pyqtSignal
+
+from .base import WorkerResult
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from PyQt6.QtCore import QRunnable
 
-    from .base import BaseWorker, WorkerResult
+    from .base import BaseWorker
 
 logger = logging.getLogger(__name__)
 
 
-# Type alias for signal connect method
+# Type aliases for PyQt6 methods with incomplete type stubs
 type SignalConnect = Callable[..., object]
+type SingleShot = Callable[[int, Callable[[], None]], None]
 
 
 class WorkerManager(QObject):
@@ -55,6 +59,13 @@ class WorkerManager(QObject):
         self._active_workers: dict[str, BaseWorker] = {}
         self._callbacks: dict[str, Callable[[WorkerResult[object]], None]] = {}
 
+        # Duplicate-request coalescing: coalesce key -> in-flight request ID,
+        # and callbacks from later submits waiting on that request.
+        self._inflight_by_key: dict[tuple[object, ...], str] = {}
+        self._chained_callbacks: dict[
+            str, list[Callable[[WorkerResult[object]], None]]
+        ] = {}
+
     @property
     def active_count(self) -> int:
         """Get the number of active workers."""
@@ -73,6 +84,10 @@ class WorkerManager(QObject):
     ) -> str:
         """Submit a worker for execution.
 
+        If an equivalent worker (same ``coalesce_key()``) is already in
+        flight, the new worker is not started; its callback is chained to the
+        existing request instead and that request's ID is returned.
+
         Args:
             worker: The worker to execute.
             on_complete: Optional callback when work completes.
@@ -80,7 +95,22 @@ class WorkerManager(QObject):
         Returns:
             The request ID for tracking.
         """
+        key = worker.coalesce_key()
+        if key is not None:
+            existing_id = self._inflight_by_key.get(key)
+            if existing_id is not None:
+                if on_complete is not None:
+                    self._chained_callbacks.setdefault(existing_id, []).append(
+                        on_complete
+                    )
+                logger.debug(
+                    "Coalesced worker %s into %s", worker.request_id, existing_id
+                )
+                return existing_id
+
         request_id = worker.request_id
+        if key is not None:
+            self._inflight_by_key[key] = request_id
 
         # Store worker and callback
         self._active_workers[request_id] = worker
@@ -93,10 +123,22 @@ class WorkerManager(QObject):
         connect_error = cast("SignalConnect", worker.signals.error.connect)
         connect_cancelled = cast("SignalConnect", worker.signals.cancelled.connect)
 
-        connect_started(self._on_worker_started)
-        connect_finished(self._on_worker_finished)
-        connect_error(self._on_worker_error)
-        connect_cancelled(self._on_worker_cancelled)
+        # Each signal fires at most once per worker, so single-shot connections
+        # drop themselves as soon as they are used.
+        once = Qt.ConnectionType.SingleShotConnection
+        connect_started(self._on_worker_started, type=once)
+        connect_finished(self._on_worker_finished, type=once)
+        connect_error(self._on_worker_error, type=once)
+        connect_cancelled(self._on_worker_cancelled, type=once)
+
+        # Trivial work (e.g. a cache hit) is not worth a pool thread; run it on
+        # this thread from the event loop so callers still get the result
+        # after submit() returns, exactly as with a pooled worker.
+        if worker.is_cheap:
+            single_shot = cast("SingleShot", QTimer.singleShot)
+            single_shot(0, worker.run)
+            logger.debug("Scheduled inline worker %s", request_id)
+            return request_id
 
         # Start execution (PyQt6 type stubs incomplete for QThreadPool.start)
         self._thread_pool.start(cast("QRunnable", worker))  # pyright: ignore[reportUnknownMemberType]
@@ -116,6 +158,7 @@ class WorkerManager(QObject):
         worker = self._active_workers.get(request_id)
         if worker is not None:
             worker.cancel()
+            self._release_key(worker)
             logger.debug("Requested cancellation for %s", request_id)
             return True
         return False
@@ -126,10 +169,16 @@ class WorkerManager(QObject):
         Returns:
             Number of workers cancelled.
         """
-        count = 0
-        for request_id in list(self._active_workers.keys()):
-            if self.cancel(request_id):
-                count += 1
+        # Worker signals are delivered on this thread, so the map cannot change
+        # while we iterate; cancel the workers directly instead of re-looking
+        # each one up by id.
+        for worker in self._active_workers.values():
+            worker.cancel()
+        self._inflight_by_key.clear()
+        # Every caller is abandoned, including those chained onto a request
+        self._chained_callbacks.clear()
+        count = len(self._active_workers)
+        logger.debug("Requested cancellation for %d workers", count)
         return count
 
     def wait_for_done(self, timeout_ms: int = -1) -> bool:
@@ -153,22 +202,36 @@ class WorkerManager(QObject):
         request_id = result.request_id
         logger.debug("Worker finished: %s (success=%s)", request_id, result.is_success)
 
-        # Invoke callback if registered
+        # Stop coalescing onto this request now that it has a result
+        worker = self._active_workers.pop(request_id, None)
+        if worker is not None:
+            self._release_key(worker)
+
+        # Invoke callback if registered, then any coalesced duplicates, before
+        # the signals below so listeners see the result already delivered
+        callbacks = self._chained_callbacks.pop(request_id, [])
         callback = self._callbacks.pop(request_id, None)
         if callback is not None:
-            try:
-                callback(result)
-            except Exception as e:
-                logger.exception("Callback error for %s: %s", request_id, e)
-
-        # Cleanup
-        self._active_workers.pop(request_id, None)
+            callbacks.insert(0, callback)
+        self._dispatch_callbacks(callbacks, result)
 
         # Emit signals
         self.worker_finished.emit(result)
         if not self._active_workers:
             self.all_workers_complete.emit()
 
+    @staticmethod
+    def _dispatch_callbacks(
+        callbacks: list[Callable[[WorkerResult[object]], None]],
+        result: WorkerResult[object],
+    ) -> None:
+        """Invoke completion callbacks, isolating their failures."""
+        for callback in callbacks:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.exception("Callback error for %s: %s", result.request_id, e)
+
     def _on_worker_error(self, request_id: str, exception: Exception) -> None:
         """Handle worker error signal."""
         logger.error("Worker error %s: %s", request_id, exception)
@@ -177,5 +240,22 @@ class WorkerManager(QObject):
     def _on_worker_cancelled(self, request_id: str) -> None:
         """Handle worker cancelled signal."""
         logger.debug("Worker cancelled: %s", request_id)
-        self._active_workers.pop(request_id, None)
+        worker = self._active_workers.pop(request_id, None)
+        if worker is not None:
+            self._release_key(worker)
         self._callbacks.pop(request_id, None)
+        # Callers chained onto this request did not cancel it themselves, so
+        # they are told it ended rather than left waiting for a result
+        followers = self._chained_callbacks.pop(request_id, [])
+        if followers:
+            error = CancelledError(f"Request {request_id} was cancelled")
+            result: WorkerResult[object] = WorkerResult(
+                data=None, error=error, request_id=request_id
+            )
+            self._dispatch_callbacks(followers, result)
+
+    def _release_key(self, worker: BaseWorker) -> None:
+        """Stop routing duplicate submits to this worker."""
+        key = worker.coalesce_key()
+        if key is not None and self._inflight_by_key.get(key) == worker.request_id:
+            del self._inflight_by_key[key]
@@ -1,25 +1,89 @@
+from dataclasses import dataclass
 import logging
 from typing import override
 
-from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtCore import QLine, QPointF, QRect, QSize, Qt
 from PyQt6.QtGui import (
     QColor,
     QFont,
     QPainter,
-    QPainterPath,
     QPaintEvent,
     QPen,
+    QPixmap,
+    QPolygonF,
+    QResizeEvent,
+    QTransform,
 )
 from PyQt6.QtWidgets import QSizePolicy, QWidget
 
 from ..services.presenter import ChartData
 
 
+@dataclass(slots=True)
+class _Layout:
+    """Plot geometry shared by all draw helpers for one widget size."""
+
+    w: int
+    h: int
+    left_m: int
+    right_m: int
+    top_m: int
+    bottom_m: int
+    graph_w: int
+    graph_h: int
+    center_x: float
+    zero_y: float
+    x_span: float
+    y_span: float
+
+
+def _min_max_decimate(prices: list[float], pnls: list[float], stride: int) -> QPolygonF:
+    """Keep each bucket's lowest and highest P&L sample, in price order."""
+    n = len(prices)
+    # Endpoints are kept so the curve still spans the full price range
+    keep = {0, n - 1}
+    for start in range(0, n, stride):
+        chunk = pnls[start : start + stride]
+        keep.add(start + chunk.index(min(chunk)))
+        keep.add(start + chunk.index(max(chunk)))
+    return QPolygonF([QPointF(prices[i], pnls[i]) for i in sorted(keep)])
+
+
 class ChartWidget(QWidget):
+    # Plot margins in pixels
+    _LEFT_M = 50
+    _RIGHT_M = 20
+    _TOP_M = 20
+    _BOTTOM_M = 30
+    # Paint resources are immutable, so they are shared across paints
+    _COLOR_BG = QColor("#F4F7FB")
+    _COLOR_LABEL = QColor("#666666")
+    _COLOR_LEGEND_TEXT = QColor("#333")
+    _PEN_GRID = QPen(QColor("#E0E0E0"), 1, Qt.PenStyle.SolidLine)
+    _PEN_ZERO = QPen(QColor("#000000"), 1)
+    _PEN_CURVE = QPen(QColor("#2E7D32"), 2)
+    _PEN_PRICE = QPen(QColor("#2196F3"), 1)
+    _PEN_LEGEND_PRICE = QPen(QColor("#2196F3"), 2)
+    _Y_STEPS = 10
+    _X_STEPS = 20
+    _FONT_SMALL = QFont("Arial", 8)
+    _FONT_PRICE = QFont("Arial", 9, QFont.Weight.Bold)
+    _LEGEND_ITEMS = (
+        ("P&L at Expiration", _PEN_CURVE),
+        ("Current Price", _PEN_LEGEND_PRICE),
+    )
+    _LEGEND_SIZE = QSize(160, 40)
+    # Below two samples per pixel, min-max decimation would keep every sample
+    _MIN_DECIMATE_STRIDE = 2
+
     def __init__(self) -> None:
         super().__init__()
         self.setMinimumHeight(350)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        # Every paint covers the whole rect, so Qt need not clear it first.
+        # WA_StaticContents is left off: the chart rescales to the widget size,
+        # so a resize must repaint everything, not only the newly exposed area.
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, on=True)
         self._prices: list[float] = []
         self._pnls: list[float] = []
         self._x_min: float = 0.0
@@ -28,8 +92,32 @@ class ChartWidget(QWidget):
         self._y_max: float = 1.0
         self._strike_lines: list[float] = []
         self._current_price: float = 0.0
+        self._layout: _Layout | None = None
+        # Both grid directions, drawn with one drawLines() call
+        self._grid_lines: list[QLine] = []
+        # Axis label text depends only on the data, so it is formatted once
+        self._y_label_texts: list[str] = []
+        self._x_label_texts: list[str] = []
+        self._y_labels: list[tuple[QRect, str]] = []
+        self._x_labels: list[tuple[QRect, str]] = []
+        # P&L samples in data space; only re-mapped to widget space on resize
+        self._samples = QPolygonF()
+        self._curve = QPolygonF()
+        # Samples reduced to the plot width, keyed by (sample count, graph_w)
+        self._decimated = QPolygonF()
+        self._decimated_key: tuple[int, int] | None = None
+        self._price_line: QLine | None = None
+        self._price_label = ""
+        self._data: ChartData | None = None
+        # Fully rendered chart, blitted on repaints until data or size change
+        self._cache: QPixmap | None = None
+        # Static legend, rendered once per device pixel ratio
+        self._legend: QPixmap | None = None
 
     def set_chart_data(self, data: ChartData) -> None:
+        if data == self._data:
+            return
+        self._data = data
         self._prices = data.prices
         self._pnls = data.pnls
         self._x_min = data.x_min
@@ -38,6 +126,11 @@ class ChartWidget(QWidget):
         self._y_max = data.y_max
         self._strike_lines = data.strike_lines
         self._current_price = data.current_price
+        self._samples = QPolygonF(list(map(QPointF, data.prices, data.pnls)))
+        self._decimated_key = None
+        self._format_axis_labels()
+        self._layout = None
+        self._cache = None
         logging.getLogger(__name__).info(
             "ChartData set: prices=%d pnls=%d x=[%.2f, %.2f] y=[%.2f, %.2f] strikes=%d current=%.2f",
             len(self._prices),
@@ -49,167 +142,253 @@ class ChartWidget(QWidget):
             len(self._strike_lines),
             self._current_price,
         )
+        # update() already merges repeated requests into one paint per pass
         self.update()
 
+    @override
+    def resizeEvent(self, a0: QResizeEvent | None) -> None:
+        self._layout = None
+        self._cache = None
+        super().resizeEvent(a0)
+
+    def _get_layout(self) -> _Layout:
+        """Return the cached plot layout, rebuilding it after a resize or new data."""
+        if self._layout is None:
+            w = self.width()
+            h = self.height()
+            left_m = self._LEFT_M
+            bottom_m = self._BOTTOM_M
+            right_m = self._RIGHT_M
+            top_m = self._TOP_M
+            graph_w = w - left_m - right_m
+            graph_h = h - bottom_m - top_m
+            self._layout = _Layout(
+                w=w,
+                h=h,
+                left_m=left_m,
+                right_m=right_m,
+                top_m=top_m,
+                bottom_m=bottom_m,
+                graph_w=graph_w,
+                graph_h=graph_h,
+                center_x=left_m + graph_w / 2,
+                # Zero line is always in the center
+                zero_y=top_m + graph_h / 2,
+                x_span=self._x_max - self._x_min,
+                # Use symmetric range around zero for centered zero line
+                y_span=2 * self._get_symmetric_y_extent(),
+            )
+            self._grid_lines = []
+            self._build_grid_y(self._layout)
+            self._build_grid_x(self._layout)
+            self._build_curve(self._layout)
+            self._build_current_price(self._layout)
+        return self._layout
+
     @override
     def paintEvent(self, a0: QPaintEvent | None) -> None:
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if not self._prices:
+            # Nothing to plot yet (e.g. before the first fetch completes)
+            self._draw_background(painter)
+            painter.setPen(self._COLOR_LABEL)
+            painter.setFont(self._FONT_SMALL)
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "No data")
+            return
+        painter.drawPixmap(0, 0, self._get_cache())
+
+    def _get_cache(self) -> QPixmap:
+        """Return the rendered chart, re-rendering after new data or a resize."""
+        dpr = self.devicePixelRatioF()
+        if self._cache is None or self._cache.devicePixelRatio() != dpr:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            painter = QPainter(pixmap)
+            self._render(painter)
+            painter.end()
+            self._cache = pixmap
+        return self._cache
+
+    def _render(self, painter: QPainter) -> None:
+        """Draw every chart layer with the given painter."""
+        layout = self._get_layout()
+        # Grid, zero line and price marker are axis-aligned on whole pixels,
+        # so only the curve is antialiased; the legend is a prerendered pixmap.
+        antialiasing = QPainter.RenderHint.Antialiasing
         self._draw_background_and_grid(painter)
-        self._draw_zero_line(painter)
-        self._draw_bell_curve(painter)
+        self._draw_zero_line(painter, layout)
+        painter.setRenderHint(antialiasing, on=True)
         self._draw_profit_loss_curves(painter)
+        painter.setRenderHint(antialiasing, on=False)
         self._draw_current_price(painter)
-        self._draw_legend(painter)
+        self._draw_legend(painter, layout)
 
     def _draw_background_and_grid(self, painter: QPainter) -> None:
         self._draw_background(painter)
-        self._draw_grid_y(painter)
-        self._draw_grid_x(painter)
+        self._paint_grid_lines(painter)
+        self._paint_grid_labels(painter)
 
     def _draw_background(self, painter: QPainter) -> None:
-        painter.fillRect(self.rect(), QColor("#F4F7FB"))
-
-    def _draw_grid_y(self, painter: QPainter) -> None:
-        w = self.width()
-        h = self.height()
-        left_m = 50
-        bottom_m = 30
-        right_m = 20
-        top_m = 20
-        graph_h = h - bottom_m - top_m
-        painter.setPen(QPen(QColor("#E0E0E0"), 1, Qt.PenStyle.SolidLine))
-        y_steps = 10
+        # The fill is opaque, so write it without blending against the target
+        modes = QPainter.CompositionMode
+        painter.setCompositionMode(modes.CompositionMode_Source)
+        painter.fillRect(self.rect(), self._COLOR_BG)
+        painter.setCompositionMode(modes.CompositionMode_SourceOver)
+
+    def _format_axis_labels(self) -> None:
+        """Format the P&L and price axis labels for the current data."""
+        y_steps = self._Y_STEPS
+        x_steps = self._X_STEPS
         y_range_threshold = 250.0
-        # Use symmetric range around zero for centered zero line
         y_extent = self._get_symmetric_y_extent()
+        y_span = 2 * y_extent
+        use_int = y_span >= y_range_threshold
+        self._y_label_texts = []
         for i in range(y_steps + 1):
-            y = top_m + (i * graph_h / y_steps)
-            painter.drawLine(left_m, int(y), w - right_m, int(y))
-            val = y_extent - (i * 2 * y_extent / y_steps)
-            use_int = abs(2 * y_extent) >= y_range_threshold
-            label = f"${val:,.0f}" if use_int else f"${val:,.2f}"
-            painter.setPen(QColor("#666666"))
-            painter.setFont(QFont("Arial", 8))
-            painter.drawText(
-                QRect(0, int(y) - 10, left_m - 5, 20),
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                label,
-            )
-            painter.setPen(QColor("#E0E0E0"))
-
-    def _draw_grid_x(self, painter: QPainter) -> None:
-        w = self.width()
-        h = self.height()
-        left_m = 50
-        bottom_m = 30
-        right_m = 20
-        top_m = 20
-        graph_w = w - left_m - right_m
-        painter.setPen(QPen(QColor("#E0E0E0"), 1, Qt.PenStyle.SolidLine))
-        x_steps = 20
+            val = y_extent - (i * y_span / y_steps)
+            self._y_label_texts.append(f"${val:,.0f}" if use_int else f"${val:,.2f}")
+        x_span = self._x_max - self._x_min
+        self._x_label_texts = [
+            f"{self._x_min + (i * x_span / x_steps):,.0f}"
+            for i in range(0, x_steps + 1, 2)
+        ]
+
+    def _build_grid_y(self, layout: _Layout) -> None:
+        """Precompute horizontal grid lines and P&L axis label positions."""
+        left_m = layout.left_m
+        y_steps = self._Y_STEPS
+        self._y_labels = []
+        for i, label in enumerate(self._y_label_texts):
+            y = int(layout.top_m + (i * layout.graph_h / y_steps))
+            self._grid_lines.append(QLine(left_m, y, layout.w - layout.right_m, y))
+            self._y_labels.append((QRect(0, y - 10, left_m - 5, 20), label))
+
+    def _build_grid_x(self, layout: _Layout) -> None:
+        """Precompute vertical grid lines and price axis label positions."""
+        top_m = layout.top_m
+        bottom_y = layout.h - layout.bottom_m
+        x_steps = self._X_STEPS
+        labels = iter(self._x_label_texts)
+        self._x_labels = []
         for i in range(x_steps + 1):
-            x = left_m + (i * graph_w / x_steps)
-            painter.drawLine(int(x), top_m, int(x), h - bottom_m)
+            x = int(layout.left_m + (i * layout.graph_w / x_steps))
+            self._grid_lines.append(QLine(x, top_m, x, bottom_y))
             if i % 2 == 0:
-                val = self._x_min + (i * (self._x_max - self._x_min) / x_steps)
-                painter.setPen(QColor("#666666"))
-                painter.drawText(
-                    QRect(int(x) - 30, h - bottom_m, 60, 20),
-                    Qt.AlignmentFlag.AlignCenter,
-                    f"{val:,.0f}",
-                )
-                painter.setPen(QColor("#E0E0E0"))
-
-    def _draw_zero_line(self, painter: QPainter) -> None:
-        w = self.width()
-        h = self.height()
-        left_m = 50
-        bottom_m = 30
-        right_m = 20
-        top_m = 20
-        graph_h = h - bottom_m - top_m
-        # Zero line is always in the center
-        zero_y = top_m + graph_h / 2
-        painter.setPen(QPen(QColor("#000000"), 1))
-        painter.drawLine(left_m, int(zero_y), w - right_m, int(zero_y))
-
-    def _draw_bell_curve(self, painter: QPainter) -> None:
-        # Bell curve removed - was decorative and not based on actual position data
-        pass
+                self._x_labels.append((QRect(x - 30, bottom_y, 60, 20), next(labels)))
+
+    def _paint_grid_lines(self, painter: QPainter) -> None:
+        """Draw both grid directions with a single pen."""
+        painter.setPen(self._PEN_GRID)
+        painter.drawLines(*self._grid_lines)
+
+    def _paint_grid_labels(self, painter: QPainter) -> None:
+        """Draw both axes' labels with a single pen and font."""
+        painter.setPen(self._COLOR_LABEL)
+        painter.setFont(self._FONT_SMALL)
+        align = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        for rect, label in self._y_labels:
+            painter.drawText(rect, align, label)
+        for rect, label in self._x_labels:
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+
+    @staticmethod
+    def _draw_zero_line(painter: QPainter, layout: _Layout) -> None:
+        zero_y = int(layout.zero_y)
+        painter.setPen(ChartWidget._PEN_ZERO)
+        painter.drawLine(layout.left_m, zero_y, layout.w - layout.right_m, zero_y)
 
     def _get_symmetric_y_extent(self) -> float:
         """Get the symmetric Y extent for centering zero line."""
         return max(abs(self._y_min), abs(self._y_max), 1.0)
 
-    def _draw_profit_loss_curves(self, painter: QPainter) -> None:
-        w = self.width()
-        h = self.height()
-        left_m = 50
-        bottom_m = 30
-        right_m = 20
-        top_m = 20
-        graph_w = w - left_m - right_m
-        graph_h = h - bottom_m - top_m
-        if not self._prices or not self._pnls:
+    def _build_curve(self, layout: _Layout) -> None:
+        """Map the P&L samples to widget coordinates as a single polyline."""
+        if self._samples.isEmpty():
+            self._curve = QPolygonF()
             return
+        left_m = float(layout.left_m)
+        top_m = float(layout.top_m)
+        # Affine transform coefficients, computed once for all samples
+        sx = float(layout.graph_w) / layout.x_span if layout.x_span else 0.0
+        x0 = left_m - self._x_min * sx
+        # Map from [-y_extent, y_extent] to [top_m + graph_h, top_m]
+        sy = float(layout.graph_h) / layout.y_span
+        y0 = top_m + layout.y_span / 2 * sy
+        # Qt applies the transform to every sample in one C++ call
+        self._curve = QTransform(sx, 0.0, 0.0, -sy, x0, y0).map(
+            self._visible_samples(layout.graph_w)
+        )
 
-        def map_x(px: float) -> float:
-            if self._x_max == self._x_min:
-                return float(left_m)
-            return float(left_m) + (px - self._x_min) / (
-                self._x_max - self._x_min
-            ) * float(graph_w)
+    def _visible_samples(self, graph_w: int) -> QPolygonF:
+        """Return the samples reduced to about two points per horizontal pixel."""
+        n = self._samples.size()
+        stride = n // max(1, graph_w)
+        if stride < self._MIN_DECIMATE_STRIDE:
+            return self._samples
+        key = (n, graph_w)
+        if key != self._decimated_key:
+            self._decimated = _min_max_decimate(self._prices, self._pnls, stride)
+            self._decimated_key = key
+        return self._decimated
 
-        # Use symmetric range around zero
-        y_extent = self._get_symmetric_y_extent()
-
-        def map_y(py: float) -> float:
-            # Map from [-y_extent, y_extent] to [top_m + graph_h, top_m]
-            return float(top_m) + (y_extent - py) / (2 * y_extent) * float(graph_h)
+    def _draw_profit_loss_curves(self, painter: QPainter) -> None:
+        if self._curve.isEmpty():
+            return
+        painter.setPen(self._PEN_CURVE)
+        painter.drawPolyline(self._curve)
 
-        path = QPainterPath()
-        path.moveTo(map_x(self._prices[0]), map_y(self._pnls[0]))
-        for i in range(1, len(self._prices)):
-            path.lineTo(map_x(self._prices[i]), map_y(self._pnls[i]))
-        painter.setPen(QPen(QColor("#2E7D32"), 2))
-        painter.drawPath(path)
+    def _build_current_price(self, layout: _Layout) -> None:
+        """Map the current price marker to its clamped widget x position."""
+        if layout.x_span == 0:
+            self._price_line = None
+            return
+        left_m = float(layout.left_m)
+        px = left_m + (self._current_price - self._x_min) / layout.x_span * float(
+            layout.graph_w
+        )
+        x = int(max(left_m, min(px, float(layout.w - layout.right_m))))
+        self._price_line = QLine(x, layout.top_m, x, layout.h - layout.bottom_m)
+        self._price_label = f"{self._current_price:,.2f}"
 
     def _draw_current_price(self, painter: QPainter) -> None:
-        w = self.width()
-        h = self.height()
-        left_m = 50
-        bottom_m = 30
-        right_m = 20
-        top_m = 20
-        graph_w = w - left_m - right_m
-        if self._x_max == self._x_min:
+        line = self._price_line
+        if line is None:
             return
-        px = float(left_m) + (self._current_price - self._x_min) / (
-            self._x_max - self._x_min
-        ) * float(graph_w)
-        px_c = max(float(left_m), min(px, float(w - right_m)))
-        painter.setPen(QPen(QColor("#2196F3"), 1))
-        painter.drawLine(int(px_c), top_m, int(px_c), h - bottom_m)
-        painter.setPen(QColor("#2196F3"))
-        painter.setFont(QFont("Arial", 9, QFont.Weight.Bold))
-        painter.drawText(int(px_c) + 5, top_m + 20, f"{self._current_price:,.2f}")
+        painter.setPen(self._PEN_PRICE)
+        painter.drawLine(line)
+        painter.setFont(self._FONT_PRICE)
+        painter.drawText(line.x1() + 5, line.y1() + 20, self._price_label)
+
+    def _draw_legend(self, painter: QPainter, layout: _Layout) -> None:
+        legend = self._get_legend(self.devicePixelRatioF())
+        painter.drawPixmap(layout.left_m + 10, layout.top_m + 10, legend)
+
+    def _get_legend(self, dpr: float) -> QPixmap:
+        """Return the legend pixmap, re-rendering it if the pixel ratio changed."""
+        legend = self._legend
+        if legend is None or legend.devicePixelRatio() != dpr:
+            legend = QPixmap(self._LEGEND_SIZE * dpr)
+            legend.setDevicePixelRatio(dpr)
+            legend.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(legend)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, on=True)
+            self._paint_legend_items(painter)
+            painter.end()
+            self._legend = legend
+        return legend
 
     @staticmethod
-    def _draw_legend(painter: QPainter) -> None:
-        left_m = 50
-        top_m = 20
-        legend_x = left_m + 10
-        legend_y = top_m + 10
+    def _paint_legend_items(painter: QPainter) -> None:
+        legend_x = 0
+        legend_y = 0
         row_h = 18
-        items = [
-            ("P&L at Expiration", Qt.PenStyle.SolidLine, QColor("#2E7D32")),
-            ("Current Price", Qt.PenStyle.SolidLine, QColor("#2196F3")),
-        ]
-        painter.setFont(QFont("Arial", 8))
-        for idx, (text, style, color) in enumerate(items):
-            y_pos = legend_y + (idx * row_h)
-            painter.setPen(QPen(color, 2, style))
-            painter.drawLine(legend_x, int(y_pos + 5), legend_x + 20, int(y_pos + 5))
-            painter.setPen(QColor("#333"))
-            painter.drawText(legend_x + 25, int(y_pos + 10), text)
+        items = ChartWidget._LEGEND_ITEMS
+        # Markers first (one pen each), then every label with a single text pen
+        for idx, (_text, pen) in enumerate(items):
+            y = legend_y + (idx * row_h) + 5
+            painter.setPen(pen)
+            painter.drawLine(legend_x, y, legend_x + 20, y)
+        painter.setPen(ChartWidget._COLOR_LEGEND_TEXT)
+        painter.setFont(ChartWidget._FONT_SMALL)
+        for idx, (text, _pen) in enumerate(items):
+            painter.drawText(legend_x + 25, legend_y + (idx * row_h) + 10, text)
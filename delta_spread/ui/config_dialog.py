@@ -30,6 +30,7 @@ class ConfigDialog(QDialog):
         self.setMinimumWidth(400)
         self._config = config
         self._setup_ui()
+        self.load_config(config)
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -40,15 +41,14 @@ class ConfigDialog(QDialog):
         form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
 
         self._use_real_data_cb = QCheckBox()
-        self._use_real_data_cb.setChecked(self._config.use_real_data)
         form.addRow("Use Real Data:", self._use_real_data_cb)
 
-        self._base_url_edit = QLineEdit(self._config.tradier_base_url)
+        self._base_url_edit = QLineEdit()
         self._base_url_edit.setPlaceholderText("https://api.tradier.com")
         self._base_url_edit.setMinimumWidth(300)
         form.addRow("Tradier Base URL:", self._base_url_edit)
 
-        self._token_edit = QLineEdit(self._config.tradier_token)
+        self._token_edit = QLineEdit()
         self._token_edit.setPlaceholderText("Enter your Tradier API token")
         self._token_edit.setEchoMode(QLineEdit.EchoMode.Password)
         self._token_edit.setMinimumWidth(300)
@@ -57,7 +57,6 @@ class ConfigDialog(QDialog):
         self._max_expiries_spin = QSpinBox()
         self._max_expiries_spin.setMinimum(1)
         self._max_expiries_spin.setMaximum(365)
-        self._max_expiries_spin.setValue(self._config.max_expiries)
         self._max_expiries_spin.setToolTip(
             "Maximum number of expiration dates to display"
         )
@@ -78,6 +77,14 @@ class ConfigDialog(QDialog):
         connect_reject(self.reject)
         layout.addWidget(buttons)
 
+    def load_config(self, config: AppConfig) -> None:
+        """Fill the form from ``config`` so the dialog can be reused."""
+        self._config = config
+        self._use_real_data_cb.setChecked(config.use_real_data)
+        self._base_url_edit.setText(config.tradier_base_url)
+        self._token_edit.setText(config.tradier_token)
+        self._max_expiries_spin.setValue(config.max_expiries)
+
     def _on_accept(self) -> None:
         self._config.use_real_data = self._use_real_data_cb.isChecked()
         self._config.tradier_base_url = self._base_url_edit.text().strip()
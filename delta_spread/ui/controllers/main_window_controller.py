@@ -7,11 +7,15 @@ state transitions.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import date
 import logging
+import time
 from typing import TYPE_CHECKING, cast
 
+from PyQt6.QtCore import QTimer
+
 from ...domain.models import (
     OptionContract,
     OptionLeg,
@@ -20,10 +24,55 @@ from ...domain.models import (
     Underlier,
 )
 from ...services.presenter import ChartData, ChartPresenter, MetricsPresenter
+from ..option_badge import OptionDetailData
 from ..styles import COLOR_DANGER_RED, COLOR_SUCCESS_GREEN
 
 # Constants
 STRIKE_TOLERANCE = 0.01  # Tolerance for comparing strike prices
+STRIKE_KEY_DIGITS = 4  # Strikes are rounded to this many digits in lookup keys
+DETAIL_CACHE_TTL = 2.0  # Seconds an option detail lookup is reused
+
+# Shared chart contents for "no strategy"; ChartData is never mutated
+_EMPTY_CHART_DATA = ChartData(
+    prices=[],
+    pnls=[],
+    x_min=0.0,
+    x_max=1.0,
+    y_min=-1.0,
+    y_max=1.0,
+    strike_lines=[],
+    current_price=0.0,
+)
+
+# Add-option menu keys mapped to the leg they create
+_OPTION_KEY_MAP: dict[str, tuple[Side, OptionType]] = {
+    "buy_call": (Side.BUY, OptionType.CALL),
+    "sell_call": (Side.SELL, OptionType.CALL),
+    "buy_put": (Side.BUY, OptionType.PUT),
+    "sell_put": (Side.SELL, OptionType.PUT),
+}
+
+# Badge colour by option type and placement by side
+_BADGE_COLORS: dict[OptionType, str] = {
+    OptionType.CALL: COLOR_SUCCESS_GREEN,
+    OptionType.PUT: COLOR_DANGER_RED,
+}
+_BADGE_PLACEMENTS: dict[Side, str] = {Side.BUY: "top", Side.SELL: "bottom"}
+
+# Numeric fields of an option details dict, converted in one pass
+_DETAIL_FIELDS = (
+    "mid",
+    "bid",
+    "ask",
+    "volume",
+    "oi",
+    "iv",
+    "delta",
+    "theta",
+    "gamma",
+    "vega",
+    "rho",
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable as TCallable
@@ -38,7 +87,6 @@ if TYPE_CHECKING:
     from ...services.strategy_manager import StrategyManager
     from ...services.trade_service import TradeServiceProtocol
     from ..chart_widget import ChartWidget
-    from ..option_badge import OptionDetailData
     from ..panels.instrument_info_panel import InstrumentInfoPanel
     from ..panels.metrics_panel import MetricsPanel
     from ..panels.strikes_panel import StrikesPanel
@@ -46,7 +94,14 @@ if TYPE_CHECKING:
     from ..timeline_widget import TimelineWidget
 
 
-@dataclass
+def _contract_key(
+    expiry: date, strike: float, option_type: OptionType
+) -> tuple[date, float, OptionType]:
+    """Build a lookup key for a contract that tolerates float noise in strikes."""
+    return (expiry, round(strike, STRIKE_KEY_DIGITS), option_type)
+
+
+@dataclass(slots=True)
 class PendingAddOption:
     """Context for a pending async add option operation."""
 
@@ -56,7 +111,7 @@ class PendingAddOption:
     is_new_strategy: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingToggle:
     """Context for a pending async toggle operation."""
 
@@ -66,7 +121,7 @@ class PendingToggle:
     strike: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingMove:
     """Context for a pending async move operation."""
 
@@ -76,7 +131,7 @@ class PendingMove:
     option_type: OptionType
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingExpiryChange:
     """Context for a pending async expiry change operation."""
 
@@ -130,6 +185,9 @@ class MainWindowController:
         self.timeline: TimelineWidget | None = None
 
         # State
+        # Last symbol committed in the instrument panel, so handlers do not
+        # have to read it back from the input widget
+        self._symbol = ""
         self.expiries: list[date] = []
         self.selected_expiry: date | None = None
         self.strikes: list[float] = []
@@ -141,11 +199,32 @@ class MainWindowController:
         # Trade persistence state
         self._current_trade_id: int | None = None
 
+        # Last aggregated strategy and its metrics; strategies are immutable,
+        # so the pair can be reused until the strategy object changes
+        self._last_aggregate: tuple[Strategy, StrategyMetrics] | None = None
+
+        # Recent option detail lookups: key -> (monotonic time, data)
+        self._detail_cache: dict[
+            tuple[object, ...], tuple[float, OptionDetailData]
+        ] = {}
+
+        # Coalesces redraws requested by completions in one event-loop pass
+        self._redraw_timer = QTimer()
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(0)
+        connect_redraw = cast(
+            "TCallable[..., object]", self._redraw_timer.timeout.connect
+        )
+        connect_redraw(self._redraw)
+
         # Pending async operations
         self._pending_add_option: PendingAddOption | None = None
         self._pending_toggle: PendingToggle | None = None
         self._pending_move: PendingMove | None = None
-        self._pending_expiry_changes: list[PendingExpiryChange] = []
+        # Keyed by contract; legs sharing a contract wait on the same quote
+        self._pending_expiry_changes: dict[
+            tuple[date, float, OptionType], list[PendingExpiryChange]
+        ] = {}
 
         # Wire async signals
         self._connect_async_signals()
@@ -180,9 +259,8 @@ class MainWindowController:
         self.render_timeline()
 
         # Chain: fetch stock quote after expiries
-        if self.instrument_panel is not None:
-            symbol = self.instrument_panel.get_symbol()
-            self.async_quote_service.fetch_stock_quote(symbol)
+        if self._symbol:
+            self.async_quote_service.fetch_stock_quote(self._symbol)
 
     def _on_strikes_loaded(
         self, symbol: str, expiry: date, strikes: list[float]
@@ -203,7 +281,8 @@ class MainWindowController:
             )
             return
 
-        self.strikes = strikes
+        # Kept sorted so the nearest strike can be found by bisection
+        self.strikes = sorted(strikes)
 
         self._logger.info(
             "load_strikes_for_expiry: symbol=%s, num_strikes=%d",
@@ -231,7 +310,7 @@ class MainWindowController:
         # If we have strikes loaded, center on the current price
         if self.strikes and self.strikes_panel is not None and quote is not None:
             current_price = quote["last"]
-            nearest = min(self.strikes, key=lambda s: abs(s - current_price))
+            nearest = self._nearest_strike(current_price)
             self._logger.info(
                 "load_strikes_for_expiry: current_price=%.2f, nearest_strike=%.2f, calling center_on_value",
                 current_price,
@@ -241,6 +320,22 @@ class MainWindowController:
             self.strikes_panel.set_selected_strikes([nearest])
             self.strikes_panel.set_current_price(current_price, symbol.upper())
 
+    def _nearest_strike(self, price: float) -> float:
+        """Return the loaded strike closest to ``price``.
+
+        Args:
+            price: The price to match; ``self.strikes`` must not be empty.
+        """
+        strikes = self.strikes
+        i = bisect_left(strikes, price)
+        if i == 0:
+            return strikes[0]
+        if i == len(strikes):
+            return strikes[-1]
+        below = strikes[i - 1]
+        above = strikes[i]
+        return below if price - below <= above - price else above
+
     def _on_quote_loaded(
         self,
         _symbol: str,
@@ -251,6 +346,9 @@ class MainWindowController:
     ) -> None:
         """Handle option quote loaded from background thread.
 
+        A single quote may be awaited by several pending operations, since
+        identical fetches are shared, so every matching operation is completed.
+
         Args:
             _symbol: The underlying symbol (unused, for signal signature).
             expiry: The expiry date.
@@ -258,19 +356,9 @@ class MainWindowController:
             option_type: CALL or PUT.
             quote: The option quote.
         """
-        # Try to complete pending add option
-        if self._complete_pending_add(expiry, strike, option_type, quote):
-            return
-
-        # Try to complete pending toggle
-        if self._complete_pending_toggle(expiry, strike, option_type, quote):
-            return
-
-        # Try to complete pending move
-        if self._complete_pending_move(expiry, strike, option_type, quote):
-            return
-
-        # Try to complete pending expiry changes
+        self._complete_pending_add(expiry, strike, option_type, quote)
+        self._complete_pending_toggle(expiry, strike, option_type, quote)
+        self._complete_pending_move(expiry, strike, option_type, quote)
         self._complete_pending_expiry_change(expiry, strike, option_type, quote)
 
     def _complete_pending_add(
@@ -320,8 +408,7 @@ class MainWindowController:
             strike,
         )
 
-        self.update_metrics()
-        self.update_chart()
+        self._schedule_redraw()
         return True
 
     def _complete_pending_toggle(
@@ -354,8 +441,7 @@ class MainWindowController:
             self.strategy_manager.update_leg_type(
                 pending.leg_idx, pending.new_type, quote.mid
             )
-            self.update_metrics()
-            self.update_chart()
+            self._schedule_redraw()
         except ValueError as e:
             self._logger.warning("Failed to toggle leg type: %s", e)
 
@@ -394,8 +480,7 @@ class MainWindowController:
             self._logger.info(
                 "Move leg: idx=%d strike=%.2f", pending.leg_idx, pending.new_strike
             )
-            self.update_metrics()
-            self.update_chart()
+            self._schedule_redraw()
         except ValueError as e:
             self._logger.warning("Failed to move leg: %s", e)
 
@@ -408,47 +493,51 @@ class MainWindowController:
         option_type: OptionType,
         quote: OptionQuote,
     ) -> bool:
-        """Complete a pending expiry change operation.
+        """Complete every pending expiry change waiting on this quote.
+
+        Legs sharing a contract share one fetch, so one quote can complete
+        several pending changes.
 
         Returns:
             True if a pending expiry change was completed, False otherwise.
         """
-        # Find matching pending expiry change
-        matching_idx: int | None = None
-        for i, pending in enumerate(self._pending_expiry_changes):
-            if (
-                pending.new_expiry == expiry
-                and pending.strike == strike
-                and pending.option_type == option_type
-            ):
-                matching_idx = i
-                break
-
-        if matching_idx is None:
+        matching = self._pending_expiry_changes.pop(
+            _contract_key(expiry, strike, option_type), None
+        )
+        if matching is None:
             return False
 
-        pending = self._pending_expiry_changes.pop(matching_idx)
-
-        try:
-            self.strategy_manager.update_leg_expiry(
-                pending.leg_idx, pending.new_expiry, quote.mid
-            )
-            self._logger.info(
-                "Updated leg %d expiry to %s with price %.2f",
-                pending.leg_idx,
-                pending.new_expiry,
-                quote.mid,
-            )
+        log_info = self._logger.isEnabledFor(logging.INFO)
+        for pending in matching:
+            try:
+                self.strategy_manager.update_leg_expiry(
+                    pending.leg_idx, pending.new_expiry, quote.mid
+                )
+                if log_info:
+                    self._logger.info(
+                        "Updated leg %d expiry to %s with price %.2f",
+                        pending.leg_idx,
+                        pending.new_expiry,
+                        quote.mid,
+                    )
+            except ValueError as e:
+                self._logger.warning("Failed to update leg expiry: %s", e)
 
-            # Only update UI if all pending expiry changes are complete
-            if not self._pending_expiry_changes:
-                self.update_metrics()
-                self.update_chart()
-        except ValueError as e:
-            self._logger.warning("Failed to update leg expiry: %s", e)
+        # Only update UI if all pending expiry changes are complete
+        if not self._pending_expiry_changes:
+            self._schedule_redraw()
 
         return True
 
+    def _schedule_redraw(self) -> None:
+        """Refresh metrics and chart once the current burst of completions ends."""
+        self._redraw_timer.start()
+
+    def _redraw(self) -> None:
+        """Refresh the metrics panel and chart."""
+        self.update_metrics()
+        self.update_chart()
+
     def _on_async_error(self, request_id: str, error: Exception) -> None:
         """Handle async API error.
 
@@ -516,11 +605,21 @@ class MainWindowController:
         Args:
             symbol: New symbol.
         """
+        self._symbol = symbol
         if not symbol:
             return
 
         self.load_expiries()
 
+    def on_data_service_changed(self) -> None:
+        """Drop results computed from the previous data service.
+
+        The strategy object survives a service swap, so without this the next
+        redraw would reuse metrics and quote data from the old service.
+        """
+        self._last_aggregate = None
+        self._detail_cache.clear()
+
     def load_expiries(self, max_expiries: int = 20) -> None:
         """Load available expiries from the data service.
 
@@ -539,10 +638,8 @@ class MainWindowController:
         if self.instrument_panel is None:
             return
 
-        symbol = self.instrument_panel.get_symbol()
-
         # Always use async service
-        self.async_quote_service.fetch_stock_quote(symbol)
+        self.async_quote_service.fetch_stock_quote(self._symbol)
 
     def render_timeline(self) -> None:
         """Render the timeline with current expiries."""
@@ -568,7 +665,7 @@ class MainWindowController:
     def _update_strategy_legs_expiry(self, new_expiry: date) -> None:
         """Update all strategy legs to a new expiry date.
 
-        Fetches new prices for each leg at the new expiry.
+        Fetches new prices for all legs at the new expiry in one batch.
 
         Args:
             new_expiry: The new expiry date for all legs.
@@ -584,12 +681,13 @@ class MainWindowController:
         if strategy.legs and strategy.legs[0].contract.expiry == new_expiry:
             return
 
-        symbol = self.instrument_panel.get_symbol()
+        symbol = self._symbol
 
         # Clear any existing pending expiry changes
         self._pending_expiry_changes.clear()
 
         # Queue up expiry change requests for each leg
+        contracts: list[tuple[float, OptionType]] = []
         for leg_idx, leg in enumerate(strategy.legs):
             pending = PendingExpiryChange(
                 leg_idx=leg_idx,
@@ -597,15 +695,14 @@ class MainWindowController:
                 strike=leg.contract.strike,
                 option_type=leg.contract.type,
             )
-            self._pending_expiry_changes.append(pending)
+            key = _contract_key(new_expiry, leg.contract.strike, leg.contract.type)
+            if key not in self._pending_expiry_changes:
+                contracts.append((leg.contract.strike, leg.contract.type))
+            self._pending_expiry_changes.setdefault(key, []).append(pending)
 
-            # Fetch quote for the leg at new expiry using async service
-            self.async_quote_service.fetch_quote(
-                symbol,
-                new_expiry,
-                leg.contract.strike,
-                leg.contract.type,
-            )
+        # Quote every distinct contract at the new expiry in one worker
+        if contracts:
+            self.async_quote_service.fetch_quotes(symbol, new_expiry, contracts)
 
     def load_strikes_for_expiry(self) -> None:
         """Load strikes for the selected expiry."""
@@ -615,12 +712,13 @@ class MainWindowController:
         if self.instrument_panel is None or self.strikes_panel is None:
             return
 
-        symbol = self.instrument_panel.get_symbol()
+        symbol = self._symbol
 
         # Always use async service
         self.async_quote_service.fetch_strikes(symbol, self.selected_expiry)
-        # Pre-fetch the full option chain to populate cache
-        self.async_quote_service.fetch_chain(symbol, self.selected_expiry)
+        # Pre-fetch the full option chain to populate cache, unless it already is
+        if not self.async_quote_service.is_chain_cached(symbol, self.selected_expiry):
+            self.async_quote_service.fetch_chain(symbol, self.selected_expiry)
 
     @staticmethod
     def _parse_option_key(key: str) -> tuple[Side, OptionType] | None:
@@ -632,13 +730,7 @@ class MainWindowController:
         Returns:
             Tuple of (Side, OptionType) or None if invalid key.
         """
-        key_map: dict[str, tuple[Side, OptionType]] = {
-            "buy_call": (Side.BUY, OptionType.CALL),
-            "sell_call": (Side.SELL, OptionType.CALL),
-            "buy_put": (Side.BUY, OptionType.PUT),
-            "sell_put": (Side.SELL, OptionType.PUT),
-        }
-        return key_map.get(key)
+        return _OPTION_KEY_MAP.get(key)
 
     def _get_add_option_context(
         self,
@@ -651,7 +743,7 @@ class MainWindowController:
         if self.instrument_panel is None or self.strikes_panel is None:
             return None
 
-        symbol = self.instrument_panel.get_symbol()
+        symbol = self._symbol
         centre = self.strikes[len(self.strikes) // 2]
 
         anchor = self.strikes_panel.get_center_strike()
@@ -755,7 +847,7 @@ class MainWindowController:
         if self.instrument_panel is None:
             return
 
-        symbol = self.instrument_panel.get_symbol()
+        symbol = self._symbol
         leg = strategy.legs[leg_idx]
 
         # Always use async service
@@ -788,7 +880,7 @@ class MainWindowController:
         if self.instrument_panel is None:
             return
 
-        symbol = self.instrument_panel.get_symbol()
+        symbol = self._symbol
         leg = strategy.legs[leg_idx]
 
         # Always use async service - executes in background worker (uses cached chain data)
@@ -808,8 +900,7 @@ class MainWindowController:
         if strategy is None:
             return
 
-        ivs = self.quote_service.get_ivs_for_strategy(strategy)
-        m = self.aggregator.aggregate(strategy, spot=strategy.underlier.spot, ivs=ivs)
+        m = self._aggregate(strategy)
 
         if self.metrics_panel is not None:
             pm = MetricsPresenter.prepare(m)
@@ -822,43 +913,31 @@ class MainWindowController:
         if strategy is None:
             return
 
-        ivs = self.quote_service.get_ivs_for_strategy(strategy)
-
-        strikes_sel: list[float] = []
-        badges: list[BadgeSpec] = []
-
-        for i, leg in enumerate(strategy.legs):
-            strikes_sel.append(leg.contract.strike)
-            color = (
-                COLOR_SUCCESS_GREEN
-                if leg.contract.type is OptionType.CALL
-                else COLOR_DANGER_RED
-            )
-            placement = "top" if leg.side is Side.BUY else "bottom"
-            text = f"{leg.side.name} {leg.contract.type.name}"
-            badges.append(
-                cast(
-                    "BadgeSpec",
-                    {
-                        "strike": leg.contract.strike,
-                        "text": text,
-                        "color_bg": color,
-                        "placement": placement,
-                        "leg_idx": i,
-                    },
-                )
+        legs = strategy.legs
+        strikes_sel = [leg.contract.strike for leg in legs]
+        badges: list[BadgeSpec] = [
+            {
+                "strike": contract.strike,
+                "text": f"{leg.side.name} {contract.type.name}",
+                "color_bg": _BADGE_COLORS[contract.type],
+                "placement": _BADGE_PLACEMENTS[leg.side],
+                "leg_idx": i,
+            }
+            for i, leg in enumerate(legs)
+            for contract in (leg.contract,)
+        ]
+
+        m = self._aggregate(strategy)
+
+        # Grid stats exist only for this log line, so skip them when it is off
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Updated chart: net=%.2f be=%s grid=%s",
+                m.net_debit_credit,
+                m.break_evens,
+                self._grid_stats(m),
             )
 
-        m = self.aggregator.aggregate(strategy, spot=strategy.underlier.spot, ivs=ivs)
-        stats = self._grid_stats(m)
-
-        self._logger.info(
-            "Updated chart: net=%.2f be=%s grid=%s",
-            m.net_debit_credit,
-            m.break_evens,
-            stats,
-        )
-
         if self.strikes_panel is not None:
             self.strikes_panel.set_selected_strikes(strikes_sel)
             self.strikes_panel.set_badges(badges)
@@ -870,11 +949,50 @@ class MainWindowController:
                 current_price=strategy.underlier.spot,
             )
             self.chart.set_chart_data(cd)
-            self.chart.repaint()
+
+    def _prefetch_leg_chains(self, strategy: Strategy) -> None:
+        """Warm the chain cache for every leg expiry in a background worker.
+
+        Option detail popups read from the cached chain, so fetching it now
+        keeps the first popup for a loaded trade from blocking on the network.
+        Services without a cache would discard the result, so they are skipped.
+
+        Args:
+            strategy: The loaded strategy.
+        """
+        svc = self.async_quote_service
+        if not svc.has_cache:
+            return
+
+        symbol = strategy.underlier.symbol
+        for expiry in {leg.contract.expiry for leg in strategy.legs}:
+            if not svc.is_chain_cached(symbol, expiry):
+                svc.fetch_chain(symbol, expiry)
+
+    def _aggregate(self, strategy: Strategy) -> StrategyMetrics:
+        """Aggregate metrics for a strategy, reusing the result for the same one.
+
+        ``update_metrics`` and ``update_chart`` run back to back for the same
+        strategy, so the second call skips the IV lookups and aggregation.
+
+        Args:
+            strategy: The strategy to aggregate.
+
+        Returns:
+            The strategy metrics.
+        """
+        cached = self._last_aggregate
+        if cached is not None and cached[0] is strategy:
+            return cached[1]
+        ivs = self.quote_service.get_ivs_for_strategy(strategy)
+        m = self.aggregator.aggregate(strategy, spot=strategy.underlier.spot, ivs=ivs)
+        self._last_aggregate = (strategy, m)
+        return m
 
     def _reset_strategy_state(self) -> None:
         """Reset strategy state and clear displays."""
         self.strategy_manager.reset()
+        self._last_aggregate = None
 
         if self.metrics_panel is not None:
             self.metrics_panel.clear_metrics()
@@ -884,18 +1002,7 @@ class MainWindowController:
             self.strikes_panel.set_badges([])
 
         if self.chart is not None:
-            self.chart.set_chart_data(
-                ChartData(
-                    prices=[],
-                    pnls=[],
-                    x_min=0.0,
-                    x_max=1.0,
-                    y_min=-1.0,
-                    y_max=1.0,
-                    strike_lines=[],
-                    current_price=0.0,
-                )
-            )
+            self.chart.set_chart_data(_EMPTY_CHART_DATA)
 
     @staticmethod
     def _grid_stats(
@@ -935,7 +1042,10 @@ class MainWindowController:
         """Get real-time option detail data for a leg.
 
         Note: Uses sync API because caller expects immediate return value for tooltip.
-        Consider refactoring to async with callback if this becomes a performance issue.
+        Details are read from the leg's cached chain, which is loaded with the
+        leg's quote or prefetched in the background when a trade is loaded; a
+        popup opened before that finishes waits on the in-flight fetch instead
+        of issuing a second request.
 
         Args:
             leg_idx: Index of the leg to get data for.
@@ -954,7 +1064,47 @@ class MainWindowController:
             return None
 
         leg = strategy.legs[leg_idx]
-        symbol = self.instrument_panel.get_symbol()
+        symbol = self._symbol
+
+        # Reopening a popup shortly after the last one reuses its data
+        contract = leg.contract
+        key = (
+            symbol,
+            contract.expiry,
+            contract.strike,
+            contract.type,
+            leg.side,
+            leg.quantity,
+        )
+        now = time.monotonic()
+        cached = self._detail_cache.get(key)
+        if cached is not None and now - cached[0] < DETAIL_CACHE_TTL:
+            return cached[1]
+
+        data = self._fetch_option_detail_data(strategy, leg_idx, symbol)
+        if data is not None:
+            self._detail_cache = {
+                k: v
+                for k, v in self._detail_cache.items()
+                if now - v[0] < DETAIL_CACHE_TTL
+            }
+            self._detail_cache[key] = (now, data)
+        return data
+
+    def _fetch_option_detail_data(
+        self, strategy: Strategy, leg_idx: int, symbol: str
+    ) -> OptionDetailData | None:
+        """Look up option detail data for a leg from the quote service.
+
+        Args:
+            strategy: The current strategy.
+            leg_idx: Index of the leg to get data for.
+            symbol: Underlying symbol.
+
+        Returns:
+            Option detail data or None if not available.
+        """
+        leg = strategy.legs[leg_idx]
 
         # Format expiration date
         exp_str = leg.contract.expiry.strftime("%m/%d/%y")
@@ -976,23 +1126,23 @@ class MainWindowController:
 
         if details is not None:
             # Use real-time data from Tradier
-            from ..option_badge import OptionDetailData  # noqa: PLC0415
-
+            raw = cast("dict[str, float | str | int]", details)
+            num = {key: float(raw.get(key, 0)) for key in _DETAIL_FIELDS}
             return OptionDetailData(
                 symbol=symbol.upper(),
                 strike=strike_str,
                 expiration=exp_str,
-                price=float(cast("float | str | int", details.get("mid", 0))),
-                bid=float(cast("float | str | int", details.get("bid", 0))),
-                ask=float(cast("float | str | int", details.get("ask", 0))),
-                volume=int(cast("float | str | int", details.get("volume", 0))),
-                oi=int(cast("float | str | int", details.get("oi", 0))),
-                iv=f"{float(cast("float | str | int", details.get("iv", 0))) * 100:.1f}%",
-                delta=float(cast("float | str | int", details.get("delta", 0))),
-                theta=float(cast("float | str | int", details.get("theta", 0))),
-                gamma=float(cast("float | str | int", details.get("gamma", 0))),
-                vega=float(cast("float | str | int", details.get("vega", 0))),
-                rho=float(cast("float | str | int", details.get("rho", 0))),
+                price=num["mid"],
+                bid=num["bid"],
+                ask=num["ask"],
+                volume=int(num["volume"]),
+                oi=int(num["oi"]),
+                iv=f"{num["iv"] * 100:.1f}%",
+                delta=num["delta"],
+                theta=num["theta"],
+                gamma=num["gamma"],
+                vega=num["vega"],
+                rho=num["rho"],
             )
 
         # Fallback to basic quote and calculated greeks
@@ -1013,9 +1163,6 @@ class MainWindowController:
             leg, strategy.underlier.spot, iv
         )
 
-        # Import here to avoid circular imports
-        from ..option_badge import OptionDetailData  # noqa: PLC0415
-
         return OptionDetailData(
             symbol=symbol.upper(),
             strike=strike_str,
@@ -1110,7 +1257,10 @@ class MainWindowController:
     def new_trade(self) -> None:
         """Clear current positions and start a new trade."""
         self.strategy_manager.strategy = None
+        self._last_aggregate = None
+        self._detail_cache.clear()
         self._current_trade_id = None
+        self._symbol = ""
         self.expiries = []
         self.selected_expiry = None
         self.strikes = []
@@ -1130,18 +1280,7 @@ class MainWindowController:
             self.strikes_panel.set_badges([])  # Clear position badges
 
         if self.chart is not None:
-            self.chart.set_chart_data(
-                ChartData(
-                    prices=[],
-                    pnls=[],
-                    x_min=0.0,
-                    x_max=1.0,
-                    y_min=-1.0,
-                    y_max=1.0,
-                    strike_lines=[],
-                    current_price=0.0,
-                )
-            )
+            self.chart.set_chart_data(_EMPTY_CHART_DATA)
 
         if self.metrics_panel is not None:
             self.metrics_panel.clear_metrics()
@@ -1168,6 +1307,9 @@ class MainWindowController:
         self.update_chart()
         self.update_metrics()
 
+        # Legs may be on expiries whose chains were never loaded
+        self._prefetch_leg_chains(strategy)
+
     def _show_message(self, message: str, *, is_error: bool = False) -> None:
         """Show a message to the user inline in the instrument panel.
 
@@ -74,6 +74,8 @@ class MainWindow(QMainWindow):
 
         self._config = AppConfig.load()
         self._logger = logging.getLogger(__name__)
+        # Built on first use and reused for later opens
+        self._config_dialog: ConfigDialog | None = None
 
         # Initialize services
         self._data_service: OptionsDataService = self._init_data_service()
@@ -259,7 +261,11 @@ class MainWindow(QMainWindow):
 
     def _open_preferences(self) -> None:
         """Open the preferences dialog."""
-        dialog = ConfigDialog(self._config, self)
+        dialog = self._config_dialog
+        if dialog is None:
+            dialog = self._config_dialog = ConfigDialog(self._config, self)
+        else:
+            dialog.load_config(self._config)
         if dialog.exec():
             self._config = dialog.get_config()
             self._logger.info("Configuration updated")
@@ -271,6 +277,7 @@ class MainWindow(QMainWindow):
             self._data_service = self._init_data_service()
             self._quote_service.data_service = self._data_service
             self._async_quote_service.data_service = self._data_service
+            self._controller.on_data_service_changed()
 
             # Refresh data with new service
             self._on_symbol_changed(self.instrument_panel.get_symbol())
@@ -304,6 +311,7 @@ class MainWindow(QMainWindow):
                 )
                 self._quote_service.data_service = self._data_service
                 self._async_quote_service.data_service = self._data_service
+                self._controller.on_data_service_changed()
 
         self._controller.on_symbol_changed(symbol)
         self._update_exp_label()
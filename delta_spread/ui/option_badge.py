@@ -3,7 +3,16 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol, TypedDict, cast, override
 
 from PyQt6.QtCore import QPoint, QRect, Qt
-from PyQt6.QtGui import QColor, QFont, QMouseEvent, QPainter, QPainterPath, QPaintEvent
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QMouseEvent,
+    QPainter,
+    QPainterPath,
+    QPaintEvent,
+    QResizeEvent,
+)
 from PyQt6.QtWidgets import (
     QDialog,
     QFrame,
@@ -59,6 +68,10 @@ class _HasDragHighlight(Protocol):
 
 
 class OptionBadge(QWidget):
+    # Paint resources are immutable, so they are shared across badges
+    _COLOR_TEXT = QColor(COLOR_TEXT_PRIMARY)
+    _FONT_LABEL = QFont("Arial", 8, QFont.Weight.Bold)
+
     def __init__(
         self,
         text: str,
@@ -72,6 +85,8 @@ class OptionBadge(QWidget):
         self.color_bg = color_bg
         self.is_call = is_call or ("CALL" in text.upper())
         self.pointer_up = pointer_up
+        self._fill_brush = QBrush(QColor(color_bg))
+        self._shape: QPainterPath | None = None
         self._leg_idx: int | None = None
         self._toggle_handler: Callable[[int, OptionType], None] | None = None
         self._remove_handler: Callable[[int], None] | None = None
@@ -131,26 +146,35 @@ class OptionBadge(QWidget):
         """Set the list of all badges at the same strike/placement position."""
         self._badge_siblings = siblings
 
+    @override
+    def resizeEvent(self, a0: QResizeEvent | None) -> None:
+        self._shape = None
+        super().resizeEvent(a0)
+
+    def _get_shape(self) -> QPainterPath:
+        """Return the cached badge outline, rebuilding it after a resize."""
+        if self._shape is None:
+            path = QPainterPath()
+            if self.pointer_up:
+                path.addRoundedRect(0, 5, self.width(), self.height() - 5, 3, 3)
+                path.moveTo(self.width() / 2 - 5, 5)
+                path.lineTo(self.width() / 2, 0)
+                path.lineTo(self.width() / 2 + 5, 5)
+            else:
+                path.addRoundedRect(0, 0, self.width(), self.height() - 5, 3, 3)
+                path.moveTo(self.width() / 2 - 5, self.height() - 5)
+                path.lineTo(self.width() / 2, self.height())
+                path.lineTo(self.width() / 2 + 5, self.height() - 5)
+            self._shape = path
+        return self._shape
+
     @override
     def paintEvent(self, a0: QPaintEvent | None) -> None:
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        path = QPainterPath()
-        if self.pointer_up:
-            path.addRoundedRect(0, 5, self.width(), self.height() - 5, 3, 3)
-            path.moveTo(self.width() / 2 - 5, 5)
-            path.lineTo(self.width() / 2, 0)
-            path.lineTo(self.width() / 2 + 5, 5)
-        else:
-            path.addRoundedRect(0, 0, self.width(), self.height() - 5, 3, 3)
-            path.moveTo(self.width() / 2 - 5, self.height() - 5)
-            path.lineTo(self.width() / 2, self.height())
-            path.lineTo(self.width() / 2 + 5, self.height() - 5)
-        painter.fillPath(path, QColor(self.color_bg))
-        painter.setPen(
-            QColor(COLOR_TEXT_PRIMARY) if self.pointer_up else Qt.GlobalColor.white
-        )
-        painter.setFont(QFont("Arial", 8, QFont.Weight.Bold))
+        painter.fillPath(self._get_shape(), self._fill_brush)
+        painter.setPen(self._COLOR_TEXT if self.pointer_up else Qt.GlobalColor.white)
+        painter.setFont(self._FONT_LABEL)
         tgt_rect = (
             self.rect().adjusted(0, 5, 0, 0)
             if self.pointer_up
@@ -162,10 +186,9 @@ class OptionBadge(QWidget):
             bubble_d = 14
             bx = self.width() - bubble_d - 2
             by = 2 if self.pointer_up else self.height() - bubble_d - 7
-            painter.setBrush(QColor(COLOR_TEXT_PRIMARY))
+            painter.setBrush(self._COLOR_TEXT)
             painter.setPen(Qt.GlobalColor.white)
             painter.drawEllipse(bx, by, bubble_d, bubble_d)
-            painter.setFont(QFont("Arial", 8, QFont.Weight.Bold))
             painter.drawText(
                 QRect(bx, by, bubble_d, bubble_d),
                 Qt.AlignmentFlag.AlignCenter,
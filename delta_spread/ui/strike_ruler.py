@@ -1,8 +1,9 @@
+from bisect import bisect_left
 from collections.abc import Callable
 import logging
 from typing import TypedDict, override
 
-from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtCore import QLine, QRect, Qt
 from PyQt6.QtGui import (
     QColor,
     QFont,
@@ -32,6 +33,12 @@ class BadgeSpec(TypedDict):
 
 
 class StrikeRuler(QWidget):
+    # Paint resources are immutable, so they are shared across paints
+    _COLOR_TICK = QColor(COLOR_TEXT_PRIMARY)
+    _COLOR_BASELINE = QColor(COLOR_GRAY_200)
+    _COLOR_PRICE = QColor(COLOR_DANGER_RED)
+    _FONT_TICK = QFont("Arial", 8)
+
     def __init__(self) -> None:
         super().__init__()
         self._strikes: list[float] = []
@@ -164,30 +171,34 @@ class StrikeRuler(QWidget):
 
     @staticmethod
     def _draw_baseline(p: QPainter, w: int, h: int) -> None:
-        p.setPen(QColor(COLOR_GRAY_200))
+        p.setPen(StrikeRuler._COLOR_BASELINE)
         p.drawLine(0, h // 2, w, h // 2)
 
     def _draw_strike_ticks(self, p: QPainter, w: int, h: int) -> None:
-        p.setFont(QFont("Arial", 8))
+        p.setFont(self._FONT_TICK)
+        p.setPen(self._COLOR_TICK)
+        p.setBrush(self._COLOR_TICK)
         margin = 50
+        mid = h // 2
+        # Ticks are drawn in a single call, before the labels so they stay
+        # underneath the label text
+        ticks: list[QLine] = []
+        labels: list[tuple[QRect, str]] = []
         for i, s in enumerate(self._strikes):
             x = i * self._pixel_step - self._scroll_x
             if x < -margin or x > w + margin:
                 continue
-            tick_h_top = 10
-            tick_h_bottom = 10
-            color = QColor(COLOR_TEXT_PRIMARY)
-            p.setPen(color)
+            tick_h = 10
             if self._center_strike is not None and s == self._center_strike:
-                p.setBrush(color)
-                p.drawEllipse(int(x) - 3, int(h // 2) - 3, 6, 6)
+                p.drawEllipse(x - 3, mid - 3, 6, 6)
             elif s in self._selected:
-                tick_h_top = 12
-                tick_h_bottom = 12
-            p.drawLine(int(x), int(h // 2 - tick_h_top), int(x), int(h // 2))
-            p.drawLine(int(x), int(h // 2), int(x), int(h // 2 + tick_h_bottom))
+                tick_h = 12
+            ticks.append(QLine(x, mid - tick_h, x, mid + tick_h))
             label = f"{s:.2f}".rstrip("0").rstrip(".")
-            rect = QRect(int(x) - 22, int(h // 2 - 24), 44, 16)
+            labels.append((QRect(x - 22, mid - 24, 44, 16), label))
+        if ticks:
+            p.drawLines(*ticks)
+        for rect, label in labels:
             p.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
 
     def _draw_current_price_indicator(self, p: QPainter, w: int) -> None:
@@ -198,7 +209,7 @@ class StrikeRuler(QWidget):
         if x_price is None:
             return
         if -margin <= x_price <= w + margin:
-            p.setPen(QColor(COLOR_DANGER_RED))
+            p.setPen(self._COLOR_PRICE)
             txt = (
                 f"{self._current_label}".strip()
                 if self._current_label is not None
@@ -321,11 +332,14 @@ class StrikeRuler(QWidget):
         super().resizeEvent(a0)
 
     def _nearest_index(self, value: float) -> int:
-        if not self._strikes:
+        # Strikes arrive sorted, so the nearest one brackets the bisection point
+        strikes = self._strikes
+        i = bisect_left(strikes, value)
+        if i == 0:
             return 0
-        return min(
-            range(len(self._strikes)), key=lambda i: abs(self._strikes[i] - value)
-        )
+        if i == len(strikes):
+            return i - 1
+        return i - 1 if value - strikes[i - 1] <= strikes[i] - value else i
 
     def _content_width(self) -> int:
         return len(self._strikes) * self._pixel_step
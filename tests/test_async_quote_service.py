@@ -7,13 +7,6 @@ from delta_spread.domain.models import OptionType
 from delta_spread.services.async_quote_service import AsyncQuoteService
 from delta_spread.services.workers.base import WorkerResult
 from delta_spread.services.workers.manager import WorkerManager
-from delta_spread.services.workers.options_worker import (
-    ChainResult,
-    ExpiriesResult,
-    QuoteResult,
-    StockQuoteResult,
-    StrikesResult,
-)
 from mocks.options_data_mock import MockOptionsDataService
 
 if TYPE_CHECKING:
@@ -69,7 +62,7 @@ def test_async_quote_service_expiries_flow_and_cancel_previous() -> None:
     callback = mgr.submitted[req2]
     callback(
         WorkerResult(
-            data=ExpiriesResult([date(2026, 1, 17)]),
+            data=[date(2026, 1, 17)],
             error=None,
             request_id=req2,
         )
@@ -128,7 +121,7 @@ def test_async_quote_service_strikes_chain_and_stock_quote_success() -> None:
     req_strikes = svc.fetch_strikes("SPX", expiry)
     mgr.submitted[req_strikes](
         WorkerResult(
-            data=StrikesResult(symbol="SPX", expiry=expiry, strikes=[1.0, 2.0]),
+            data=[1.0, 2.0],
             error=None,
             request_id=req_strikes,
         )
@@ -137,7 +130,7 @@ def test_async_quote_service_strikes_chain_and_stock_quote_success() -> None:
     req_chain = svc.fetch_chain("SPX", expiry)
     mgr.submitted[req_chain](
         WorkerResult(
-            data=ChainResult(symbol="SPX", expiry=expiry, chain=[]),
+            data=[],
             error=None,
             request_id=req_chain,
         )
@@ -146,7 +139,7 @@ def test_async_quote_service_strikes_chain_and_stock_quote_success() -> None:
     req_stock = svc.fetch_stock_quote("SPX")
     mgr.submitted[req_stock](
         WorkerResult(
-            data=StockQuoteResult(symbol="SPX", quote=None),
+            data=None,
             error=None,
             request_id=req_stock,
         )
@@ -173,19 +166,131 @@ def test_async_quote_service_quote_success_emits() -> None:
     quote = data.get_quote("SPX", expiry, 6600.0, OptionType.CALL)
     mgr.submitted[req](
         WorkerResult(
-            data=QuoteResult(
-                symbol="SPX",
-                expiry=expiry,
-                strike=6600.0,
-                option_type=OptionType.CALL,
-                quote=quote,
-            ),
+            data=quote,
             error=None,
             request_id=req,
         )
     )
 
-    assert quotes and quotes[0][0] == "SPX"
+    assert quotes == [("SPX", expiry, 6600.0, OptionType.CALL, quote)]
+
+
+def test_async_quote_service_coalesced_quotes_emit_per_caller() -> None:
+    class CoalescingWorkerManager(FakeWorkerManager):
+        def __init__(self) -> None:
+            super().__init__()
+            self.callbacks: list[Callable[[WorkerResult[object]], None]] = []
+
+        def submit(
+            self,
+            _worker,
+            *,
+            on_complete: Callable[[WorkerResult[object]], None] | None = None,
+        ) -> str:
+            # Every submit joins one in-flight request, like WorkerManager does
+            if on_complete is not None:
+                self.callbacks.append(on_complete)
+            return "shared"
+
+    mgr = CoalescingWorkerManager()
+    data = MockOptionsDataService(today=date(2025, 11, 20))
+    svc = AsyncQuoteService(data, worker_manager=mgr)
+
+    quotes: list[tuple[str, date, float, object, object]] = []
+    svc.quote_loaded.connect(
+        lambda sym, exp, strike, t, q: quotes.append((sym, exp, strike, t, q))
+    )
+
+    expiry = data.get_expiries()[0]
+    req1 = svc.fetch_quote("SPX", expiry, 6600.0, OptionType.CALL)
+    req2 = svc.fetch_quote("SPX", expiry, 6600.0, OptionType.CALL)
+    assert req1 == req2 == "shared"
+
+    quote = data.get_quote("SPX", expiry, 6600.0, OptionType.CALL)
+    result = WorkerResult(data=quote, error=None, request_id="shared")
+    mgr.callbacks[0](result)
+    assert svc.is_loading is True
+    mgr.callbacks[1](result)
+
+    assert svc.is_loading is False
+    assert quotes == [("SPX", expiry, 6600.0, OptionType.CALL, quote)] * 2
+
+
+def test_async_quote_service_is_chain_cached_without_cache_support() -> None:
+    data = MockOptionsDataService(today=date(2025, 11, 20))
+    svc = AsyncQuoteService(data, worker_manager=FakeWorkerManager())
+
+    assert svc.has_cache is False
+    assert svc.is_chain_cached("SPX", data.get_expiries()[0]) is False
+
+
+def test_async_quote_service_quote_batch_emits_per_contract() -> None:
+    mgr = FakeWorkerManager()
+    data = MockOptionsDataService(today=date(2025, 11, 20))
+    svc = AsyncQuoteService(data, worker_manager=mgr)
+
+    quotes: list[tuple[str, date, float, object, object]] = []
+    loading: list[tuple[str, str]] = []
+    svc.quote_loaded.connect(
+        lambda sym, exp, strike, t, q: quotes.append((sym, exp, strike, t, q))
+    )
+    svc.loading_started.connect(lambda op: loading.append(("start", op)))
+    svc.loading_finished.connect(lambda op: loading.append(("end", op)))
+
+    expiry = data.get_expiries()[0]
+    contracts = [(6600.0, OptionType.CALL), (6500.0, OptionType.PUT)]
+    req = svc.fetch_quotes("SPX", expiry, contracts)
+    assert svc.is_loading is True
+
+    call = data.get_quote("SPX", expiry, 6600.0, OptionType.CALL)
+    put = data.get_quote("SPX", expiry, 6500.0, OptionType.PUT)
+    mgr.submitted[req](WorkerResult(data=[call, put], error=None, request_id=req))
+
+    assert svc.is_loading is False
+    assert quotes == [
+        ("SPX", expiry, 6600.0, OptionType.CALL, call),
+        ("SPX", expiry, 6500.0, OptionType.PUT, put),
+    ]
+    assert loading == [("start", "quotes"), ("end", "quotes")]
+
+
+def test_async_quote_service_quote_batch_skips_missing_contracts() -> None:
+    mgr = FakeWorkerManager()
+    data = MockOptionsDataService(today=date(2025, 11, 20))
+    svc = AsyncQuoteService(data, worker_manager=mgr)
+
+    quotes: list[tuple[float, object]] = []
+    svc.quote_loaded.connect(
+        lambda _sym, _exp, strike, t, _q: quotes.append((strike, t))
+    )
+
+    expiry = data.get_expiries()[0]
+    contracts = [(6600.0, OptionType.CALL), (6500.0, OptionType.PUT)]
+    req = svc.fetch_quotes("SPX", expiry, contracts)
+
+    call = data.get_quote("SPX", expiry, 6600.0, OptionType.CALL)
+    mgr.submitted[req](WorkerResult(data=[call, None], error=None, request_id=req))
+
+    assert quotes == [(6600.0, OptionType.CALL)]
+    assert svc.is_loading is False
+
+
+def test_async_quote_service_drops_results_after_cancel_all() -> None:
+    mgr = FakeWorkerManager()
+    data = MockOptionsDataService(today=date(2025, 11, 20))
+    svc = AsyncQuoteService(data, worker_manager=mgr)
+
+    strikes_loaded: list[list[float]] = []
+    svc.strikes_loaded.connect(
+        lambda _sym, _exp, strikes: strikes_loaded.append(strikes)
+    )
+
+    expiry = data.get_expiries()[0]
+    req = svc.fetch_strikes("SPX", expiry)
+    svc.cancel_all()
+    mgr.submitted[req](WorkerResult(data=[1.0], error=None, request_id=req))
+
+    assert strikes_loaded == []
 
 
 def test_async_quote_service_cancel_all_clears_tracking() -> None:
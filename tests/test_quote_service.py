@@ -191,6 +191,51 @@ def test_quote_service_get_ivs_for_strategy_calls_data_service_for_each_leg() ->
     ]
 
 
+class RecordingDataService(MockOptionsDataService):
+    def __init__(self):
+        super().__init__(today=date(2025, 11, 20))
+        self.calls: list[tuple[str, date, float, OptionType]] = []
+
+    def get_quote(self, symbol: str, expiry: date, strike: float, type: OptionType):  # type: ignore[override]
+        self.calls.append((symbol, expiry, strike, type))
+        return super().get_quote(symbol, expiry, strike, type)
+
+
+def test_quote_service_get_ivs_for_strategy_quotes_shared_contract_once() -> None:
+    ds = RecordingDataService()
+    service = QuoteService(ds)
+
+    u = Underlier(symbol="SPX", spot=6600.0, multiplier=100, currency="USD")
+    expiry = date(2025, 12, 15)
+    contract = OptionContract(
+        underlier=u, expiry=expiry, strike=6600.0, type=OptionType.CALL
+    )
+    legs = [
+        OptionLeg(contract=contract, side=Side.BUY, quantity=1),
+        OptionLeg(contract=contract, side=Side.SELL, quantity=2),
+    ]
+    strategy = Strategy(name="Same", underlier=u, legs=legs)
+
+    ivs = service.get_ivs_for_strategy(strategy)
+    assert set(ivs.keys()) == {(6600.0, OptionType.CALL)}
+    assert ds.calls == [("SPX", expiry, 6600.0, OptionType.CALL)]
+
+
+def test_quote_service_get_ivs_keys_by_contract_and_skips_repeats() -> None:
+    ds = RecordingDataService()
+    service = QuoteService(ds)
+
+    expiry = date(2025, 12, 15)
+    call = (expiry, 6600.0, OptionType.CALL)
+    put = (expiry, 6500.0, OptionType.PUT)
+
+    ivs = service.get_ivs("SPX", [call, put, call])
+    assert set(ivs.keys()) == {call, put}
+    reference = MockOptionsDataService(today=date(2025, 11, 20))
+    assert ivs[call] == reference.get_quote("SPX", *call).iv
+    assert ds.calls == [("SPX", *call), ("SPX", *put)]
+
+
 def test_quote_service_get_quote_delegates() -> None:
     service = QuoteService(MockOptionsDataService(today=date(2025, 11, 20)))
     expiry = date(2025, 12, 15)
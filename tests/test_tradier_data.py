@@ -119,6 +119,29 @@ class TestTradierOptionsDataService:
         assert all(hasattr(quote, "ask") for quote in chain)
         assert all(hasattr(quote, "iv") for quote in chain)
 
+    @staticmethod
+    @patch("delta_spread.data.tradier_data.requests.get")
+    def test_is_cached(mock_get, mock_tradier_service, mock_chain_response):
+        """Test that cache hits are reported per method and arguments."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_chain_response.toDict()
+        mock_response.raise_for_status = MagicMock()
+        mock_get.return_value = mock_response
+
+        expiry = date(2025, 12, 31)
+        assert mock_tradier_service.is_cached("get_chain", ("SPY", expiry)) is False
+        assert mock_tradier_service.is_cached("get_expiries") is False
+
+        mock_tradier_service.get_chain("SPY", expiry)
+
+        for method in ("get_strikes", "get_chain", "get_quote"):
+            assert mock_tradier_service.is_cached(method, ("spy", expiry)) is True
+        assert (
+            mock_tradier_service.is_cached("get_chain", ("SPY", date(2026, 1, 15)))
+            is False
+        )
+        assert mock_tradier_service.is_cached("get_chain") is False
+
     @staticmethod
     @patch("delta_spread.data.tradier_data.requests.get")
     def test_parse_option_quote(_mock_get, mock_tradier_service):
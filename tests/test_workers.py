@@ -1,26 +1,39 @@
 from __future__ import annotations
 
+from concurrent.futures import CancelledError
 from datetime import date
+from functools import cache
+import threading
 
-from delta_spread.domain.models import OptionType
-from delta_spread.services.workers.base import BaseWorker, WorkerResult
+from PyQt6 import QtCore
+
+from delta_spread.domain.models import OptionQuote, OptionType
+from delta_spread.services.workers.base import (
+    BaseWorker,
+    CallableWorker,
+    WorkerResult,
+)
 from delta_spread.services.workers.manager import WorkerManager
 from delta_spread.services.workers.options_worker import (
-    ChainResult,
-    ExpiriesResult,
-    FetchChainWorker,
-    FetchExpiriesWorker,
-    FetchQuoteWorker,
-    FetchStockQuoteWorker,
-    FetchStrikesWorker,
-    QuoteRequest,
-    QuoteResult,
-    StockQuoteResult,
-    StrikesResult,
+    fetch_quotes,
+    fetch_stock_quote,
 )
 from mocks.options_data_mock import MockOptionsDataService
 
 
+@cache
+def _qt_app() -> QtCore.QCoreApplication:
+    """Return a Qt application kept alive for the whole test session."""
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def _process_events() -> None:
+    """Run pending zero-delay timers (deferred inline workers)."""
+    app = _qt_app()
+    for _ in range(3):
+        app.processEvents()
+
+
 def test_worker_result_is_success() -> None:
     assert WorkerResult(data=1, error=None, request_id="x").is_success is True
     assert WorkerResult(data=None, error=None, request_id="x").is_success is False
@@ -44,6 +57,35 @@ def test_base_worker_run_cancelled_before_start() -> None:
     assert cancelled == ["req"]
 
 
+def test_base_worker_cancel_waits_for_started_emit() -> None:
+    class OkWorker(BaseWorker):
+        def execute(self) -> object:
+            return 1
+
+    worker = OkWorker("req")
+    events: list[str] = []
+    blocked: list[bool] = []
+
+    def on_started(_rid: str) -> None:
+        events.append("started")
+        canceller = threading.Thread(target=worker.cancel)
+        canceller.start()
+        canceller.join(0.05)
+        # The start transition is still in progress, so cancel() must wait
+        blocked.append(canceller.is_alive())
+        # A slot on the worker's own thread may still cancel without deadlock
+        worker.cancel()
+
+    worker.signals.started.connect(on_started)
+    worker.signals.finished.connect(lambda _res: events.append("finished"))
+    worker.signals.cancelled.connect(lambda _rid: events.append("cancelled"))
+
+    worker.run()
+
+    assert blocked == [True]
+    assert events == ["started", "cancelled"]
+
+
 def test_base_worker_run_success_error_and_cancel_after_execute() -> None:
     class OkWorker(BaseWorker):
         def execute(self) -> object:
@@ -87,46 +129,89 @@ def test_base_worker_run_success_error_and_cancel_after_execute() -> None:
     assert cancelled_ids == ["cancel"]
 
 
-def test_options_workers_execute_mapping() -> None:
+def test_base_worker_error_after_cancel_emits_only_cancelled() -> None:
+    class CancelThenFailWorker(BaseWorker):
+        def execute(self) -> object:
+            self.cancel()
+            raise ValueError("aborted")
+
+    worker = CancelThenFailWorker("req")
+    events: list[str] = []
+    worker.signals.started.connect(lambda _rid: events.append("started"))
+    worker.signals.finished.connect(lambda _res: events.append("finished"))
+    worker.signals.error.connect(lambda _rid, _exc: events.append("error"))
+    worker.signals.cancelled.connect(lambda _rid: events.append("cancelled"))
+
+    worker.run()
+
+    assert events == ["started", "cancelled"]
+
+
+def test_callable_worker_calls_data_service() -> None:
     svc = MockOptionsDataService(today=date(2025, 11, 20))
     expiry = svc.get_expiries()[0]
 
-    exp_worker = FetchExpiriesWorker(svc, request_id="exp")
-    exp_result = exp_worker.execute()
-    assert isinstance(exp_result, ExpiriesResult)
+    exp_worker = CallableWorker(svc.get_expiries, request_id="exp")
+    assert exp_worker.request_id == "exp"
+    assert exp_worker.execute() == svc.get_expiries()
 
-    strikes_worker = FetchStrikesWorker(
-        svc, symbol="SPX", expiry=expiry, request_id="stk"
-    )
-    strikes_result = strikes_worker.execute()
-    assert isinstance(strikes_result, StrikesResult)
-    assert strikes_result.symbol == "SPX"
-
-    chain_worker = FetchChainWorker(svc, symbol="SPX", expiry=expiry, request_id="chn")
-    chain_result = chain_worker.execute()
-    assert isinstance(chain_result, ChainResult)
-    assert chain_result.symbol == "SPX"
-
-    req = QuoteRequest(
-        symbol="SPX",
-        expiry=expiry,
-        strike=strikes_result.strikes[0],
-        option_type=OptionType.CALL,
+    strikes_worker = CallableWorker(svc.get_strikes, ("SPX", expiry))
+    strikes = strikes_worker.execute()
+    assert strikes == svc.get_strikes("SPX", expiry)
+
+    quote_worker = CallableWorker(
+        svc.get_quote, ("SPX", expiry, 6600.0, OptionType.CALL)
     )
-    quote_worker = FetchQuoteWorker(svc, req, request_id="q")
-    quote_result = quote_worker.execute()
-    assert isinstance(quote_result, QuoteResult)
-    assert quote_result.option_type is OptionType.CALL
+    assert isinstance(quote_worker.execute(), OptionQuote)
+
+    finished: list[WorkerResult[object]] = []
+    chain_worker = CallableWorker(svc.get_chain, ("SPX", expiry), request_id="chn")
+    chain_worker.signals.finished.connect(finished.append)
+    chain_worker.run()
+    assert finished[0].request_id == "chn"
+    chain = finished[0].data
+    assert isinstance(chain, list)
+    assert len(chain) == len(svc.get_chain("SPX", expiry))
 
 
-def test_fetch_stock_quote_worker_non_tradier_returns_none() -> None:
+def test_fetch_stock_quote_non_tradier_returns_none() -> None:
     svc = MockOptionsDataService(today=date(2025, 11, 20))
-    worker = FetchStockQuoteWorker(svc, symbol="SPX", request_id="sq")
-    result = worker.execute()
 
-    assert isinstance(result, StockQuoteResult)
-    assert result.symbol == "SPX"
-    assert result.quote is None
+    assert fetch_stock_quote(svc) is None
+
+
+def test_fetch_quotes_returns_one_quote_per_contract_in_order() -> None:
+    svc = MockOptionsDataService(today=date(2025, 11, 20))
+    expiry = svc.get_expiries()[0]
+    contracts = ((6600.0, OptionType.CALL), (6500.0, OptionType.PUT))
+
+    quotes = fetch_quotes(svc, "SPX", expiry, contracts)
+
+    # Quotes are stamped with the time they were made, so compare prices only
+    expected = [
+        svc.get_quote("SPX", expiry, 6600.0, OptionType.CALL),
+        svc.get_quote("SPX", expiry, 6500.0, OptionType.PUT),
+    ]
+    assert [(q.bid, q.ask, q.mid, q.iv) for q in quotes] == [
+        (q.bid, q.ask, q.mid, q.iv) for q in expected
+    ]
+
+
+def test_fetch_quotes_marks_missing_contract_without_failing_batch() -> None:
+    class PartialDataService(MockOptionsDataService):
+        def get_quote(self, symbol, expiry, strike, type):  # type: ignore[override]
+            if type is OptionType.PUT:
+                raise ValueError("Option not found")
+            return super().get_quote(symbol, expiry, strike, type)
+
+    svc = PartialDataService(today=date(2025, 11, 20))
+    expiry = svc.get_expiries()[0]
+    contracts = ((6600.0, OptionType.CALL), (6500.0, OptionType.PUT))
+
+    quotes = fetch_quotes(svc, "SPX", expiry, contracts)
+
+    assert quotes[0] is not None
+    assert quotes[1] is None
 
 
 def test_worker_manager_submit_and_callbacks(monkeypatch) -> None:
@@ -158,15 +243,152 @@ def test_worker_manager_submit_and_callbacks(monkeypatch) -> None:
     worker = OkWorker("req")
 
     callbacks: list[WorkerResult[object]] = []
-    manager.submit(worker, on_complete=callbacks.append)
+    events: list[str] = []
+    manager.all_workers_complete.connect(lambda: events.append("complete"))
+    manager.submit(
+        worker,
+        on_complete=lambda r: (callbacks.append(r), events.append("callback")),
+    )
 
+    # Results reach callbacks before listeners hear that all work is done
+    assert events == ["callback", "complete"]
     assert manager.active_count == 0
     assert len(callbacks) == 1
     assert callbacks[0].is_success is True
 
+    # Fired signals are single-shot connections and have been released
+    assert worker.signals.receivers(worker.signals.started) == 0
+    assert worker.signals.receivers(worker.signals.finished) == 0
+
     assert manager.wait_for_done(1) is True
 
 
+def test_worker_manager_runs_cheap_worker_inline(monkeypatch) -> None:
+    class FailingThreadPool:
+        def setMaxThreadCount(self, _n: int) -> None:
+            return None
+
+        def start(self, _runnable) -> None:
+            raise AssertionError("cheap workers must not use the thread pool")
+
+    from PyQt6 import QtCore
+
+    monkeypatch.setattr(
+        QtCore.QThreadPool, "globalInstance", lambda: FailingThreadPool()
+    )
+    manager = WorkerManager()
+    worker = CallableWorker(lambda: "cached", is_cheap=True)
+
+    callbacks: list[WorkerResult[object]] = []
+    request_id = manager.submit(worker, on_complete=callbacks.append)
+
+    # Delivery is deferred to the event loop, never inside submit()
+    assert callbacks == []
+    assert manager.active_count == 1
+
+    _process_events()
+
+    assert manager.active_count == 0
+    assert len(callbacks) == 1
+    assert callbacks[0].request_id == request_id
+    assert callbacks[0].data == "cached"
+
+
+def test_worker_manager_coalesces_duplicate_requests(monkeypatch) -> None:
+    started: list[BaseWorker] = []
+
+    class DeferredThreadPool:
+        def setMaxThreadCount(self, _n: int) -> None:
+            return None
+
+        def start(self, runnable) -> None:
+            started.append(runnable)
+
+    from PyQt6 import QtCore
+
+    monkeypatch.setattr(
+        QtCore.QThreadPool, "globalInstance", lambda: DeferredThreadPool()
+    )
+
+    manager = WorkerManager()
+    calls: list[str] = []
+
+    def fetch(symbol: str) -> str:
+        calls.append(symbol)
+        return symbol.lower()
+
+    callbacks: list[tuple[str, WorkerResult[object]]] = []
+    req1 = manager.submit(
+        CallableWorker(fetch, ("SPY",), coalesce=True),
+        on_complete=lambda r: callbacks.append(("first", r)),
+    )
+    req2 = manager.submit(
+        CallableWorker(fetch, ("SPY",), coalesce=True),
+        on_complete=lambda r: callbacks.append(("second", r)),
+    )
+    req3 = manager.submit(CallableWorker(fetch, ("QQQ",), coalesce=True))
+
+    assert req2 == req1
+    assert req3 != req1
+    assert len(started) == 2
+    assert manager.active_count == 2
+
+    started[0].run()
+
+    assert calls == ["SPY"]
+    assert [name for name, _ in callbacks] == ["first", "second"]
+    assert all(r.data == "spy" and r.request_id == req1 for _, r in callbacks)
+
+    # Once finished, an equal request starts a fresh worker
+    req4 = manager.submit(CallableWorker(fetch, ("SPY",), coalesce=True))
+    assert req4 != req1
+    assert len(started) == 3
+
+    # A cancelled request is no longer a coalescing target
+    assert manager.cancel(req4) is True
+    req5 = manager.submit(CallableWorker(fetch, ("SPY",), coalesce=True))
+    assert req5 != req4
+
+
+def test_worker_manager_cancelled_owner_reports_to_chained_callers(
+    monkeypatch,
+) -> None:
+    started: list[BaseWorker] = []
+
+    class DeferredThreadPool:
+        def setMaxThreadCount(self, _n: int) -> None:
+            return None
+
+        def start(self, runnable) -> None:
+            started.append(runnable)
+
+    from PyQt6 import QtCore
+
+    monkeypatch.setattr(
+        QtCore.QThreadPool, "globalInstance", lambda: DeferredThreadPool()
+    )
+
+    manager = WorkerManager()
+    callbacks: list[tuple[str, WorkerResult[object]]] = []
+    owner = manager.submit(
+        CallableWorker(str.lower, ("SPY",), coalesce=True),
+        on_complete=lambda r: callbacks.append(("owner", r)),
+    )
+    manager.submit(
+        CallableWorker(str.lower, ("SPY",), coalesce=True),
+        on_complete=lambda r: callbacks.append(("follower", r)),
+    )
+
+    assert manager.cancel(owner) is True
+    started[0].run()
+
+    assert [name for name, _ in callbacks] == ["follower"]
+    result = callbacks[0][1]
+    assert result.request_id == owner
+    assert isinstance(result.error, CancelledError)
+    assert manager.active_count == 0
+
+
 def test_worker_manager_cancel_paths(monkeypatch) -> None:
     class ImmediateThreadPool:
         def setMaxThreadCount(self, _n: int) -> None: